@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import io
 import os
-import tempfile
 from pathlib import Path
-from typing import Iterable
+from typing import Any
 
 from flask import (
     Flask,
+    Response,
     abort,
     flash,
     jsonify,
@@ -20,14 +19,18 @@ from flask import (
     send_from_directory,
     url_for,
 )
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.utils import secure_filename
 
-from datetime import datetime
+from datetime import datetime, timezone
 
+from pokedata_core import json_utils, upload_cache
+from pokedata_core.jobs import JOB_DONE, get_job, iter_job_events, submit_job
 from pokedata_core.logging_utils import get_logger, setup_logging
-from pokedata_core.pipeline import ensure_dependencies_ready, process_to_csv
+from pokedata_core.pipeline import ensure_dependencies_ready, process_to_csv, row_is_degraded
 from pokedata_core.review_store import (
     append_feedback,
+    get_csv_path,
     get_image_path,
     list_runs,
     load_run,
@@ -36,21 +39,56 @@ from pokedata_core.review_store import (
     store_run,
     write_annotations,
 )
+from pokedata_core.upload_pool import acquire_workdir, release_workdir
 
 
 logger = get_logger("web")
 
 
-ALLOWED_EXTENSIONS: Iterable[str] = {"pdf", "png", "jpg", "jpeg", "tif", "tiff", "bmp", "webp"}
+ALLOWED_EXTENSIONS: frozenset[str] = frozenset(
+    {"pdf", "png", "jpg", "jpeg", "tif", "tiff", "bmp", "webp"}
+)
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB copy buffer when spooling uploads to disk
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes/decodes through :mod:`json_utils` (orjson)."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return json_utils.dumps_str(obj, indent=bool(kwargs.get("indent")))
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return json_utils.loads(s)
 
 
 def _allowed_file(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition(".")
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
+
+
+def _save_upload(upload, dest: Path) -> str:
+    """Write the upload to ``dest`` and return the hex digest of its content.
+
+    The (already spooled) upload is copied in fixed-size chunks so the file never
+    has to be held in memory in one piece; each chunk is hashed on the way through.
+    """
+
+    hasher = upload_cache.new_hasher()
+    read = upload.stream.read
+    with dest.open("wb") as fh:
+        while True:
+            chunk = read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            fh.write(chunk)
+    return hasher.hexdigest()
 
 
 def create_app() -> Flask:
     setup_logging()
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     app.config.update(
         SECRET_KEY="dev",  # For flashing messages only; replace if deploying
         MAX_CONTENT_LENGTH=200 * 1024 * 1024,  # 200 MB uploads
@@ -87,38 +125,51 @@ def create_app() -> Flask:
         safe_name = secure_filename(upload.filename)
 
         try:
-            with tempfile.TemporaryDirectory(prefix="pokedata_") as tmpdir:
-                tmp_path = Path(tmpdir)
-                input_path = tmp_path / safe_name
-                upload.save(input_path)
-
-                output_csv = tmp_path / f"{input_path.stem}_cards.csv"
-                result = process_to_csv(input_path, output_csv, limit=limit, dpi=dpi)
-                run_meta = store_run(result, safe_name)
-
-                csv_bytes = (
-                    result.csv_path.read_bytes() if result.csv_path and result.csv_path.exists() else b""
-                )
-                csv_stream = io.BytesIO(csv_bytes)
-                csv_stream.seek(0)
-
-            download_name = (
-                result.csv_path.name if result.csv_path else f"{input_path.stem}_cards.csv"
-            )
+            workdir = acquire_workdir()
+            try:
+                input_path = workdir / safe_name
+                digest = _save_upload(upload, input_path)
+                download_name = f"{input_path.stem}_cards.csv"
+
+                cache_key = upload_cache.cache_key(digest, dpi=dpi, limit=limit)
+                cached = upload_cache.lookup(cache_key)
+                if cached is None:
+                    output_csv = workdir / download_name
+                    result = process_to_csv(input_path, output_csv, limit=limit, dpi=dpi)
+                    # store_run copies the CSV into Outputs/<run_id>/, which outlives
+                    # the scratch directory and can be streamed straight from disk.
+                    run_meta = store_run(result, safe_name)
+                    run_id = run_meta.get("run_id", "")
+                    run_csv_path = get_csv_path(run_id)
+                    csv_source: Any = str(run_csv_path)
+                    rows = len(result.rows)
+                    # A page that hit a transient failure would otherwise be
+                    # served from the cache after the failure has cleared.
+                    if not any(row_is_degraded(row) for row in result.rows):
+                        upload_cache.store(cache_key, run_csv_path, run_id=run_id, rows=rows)
+                else:
+                    logger.info("Serving cached result for %s (run %s)", safe_name, cached.run_id)
+                    run_id = cached.run_id
+                    csv_source = cached.csv_file
+                    rows = cached.rows
+            finally:
+                release_workdir(workdir)
+
             logger.info(
                 "Web processing complete: %s -> %s (%d rows)",
                 safe_name,
                 download_name,
-                len(result.rows),
+                rows,
             )
             response = send_file(
-                csv_stream,
+                csv_source,
                 mimetype="text/csv",
                 as_attachment=True,
                 download_name=download_name,
+                conditional=True,
             )
-            response.headers["X-Processed-Rows"] = str(len(result.rows))
-            response.headers["X-Run-Id"] = run_meta.get("run_id", "")
+            response.headers["X-Processed-Rows"] = str(rows)
+            response.headers["X-Run-Id"] = run_id
             return response
         except Exception as exc:  # noqa: BLE001 - surfaced to user via flash
             logger.exception("Web processing failed for %s", safe_name)
@@ -128,6 +179,80 @@ def create_app() -> Flask:
             flash(f"Processing failed: {message}")
             return redirect(url_for("index"))
 
+    @app.post("/api/process")
+    def api_process():
+        """Queue an upload for background processing and return its job id."""
+
+        upload = request.files.get("card_file")
+        dpi = request.form.get("dpi", type=int) or 300
+        limit = request.form.get("limit", type=int) or 0
+
+        if upload is None or upload.filename == "":
+            return jsonify({"error": "Select a PDF or image to process."}), 400
+        if not _allowed_file(upload.filename):
+            return jsonify({"error": "Unsupported file type. Upload a PDF or image scan."}), 400
+
+        safe_name = secure_filename(upload.filename)
+        staging_dir = acquire_workdir()
+        input_path = staging_dir / safe_name
+        try:
+            _save_upload(upload, input_path)
+        except Exception:
+            release_workdir(staging_dir)
+            raise
+
+        job = submit_job(input_path, safe_name, dpi=dpi, limit=limit)
+        payload = job.to_dict()
+        payload["status_url"] = url_for("api_job", job_id=job.job_id)
+        payload["events_url"] = url_for("api_job_events", job_id=job.job_id)
+        payload["csv_url"] = url_for("api_job_csv", job_id=job.job_id)
+        return jsonify(payload), 202
+
+    @app.get("/api/jobs/<job_id>")
+    def api_job(job_id: str):
+        job = get_job(job_id)
+        if job is None:
+            abort(404)
+        return jsonify(job.to_dict())
+
+    @app.get("/api/jobs/<job_id>/events")
+    def api_job_events(job_id: str):
+        job = get_job(job_id)
+        if job is None:
+            abort(404)
+
+        def stream():
+            for snapshot in iter_job_events(job):
+                if snapshot is None:
+                    yield ": keepalive\n\n"
+                else:
+                    yield f"data: {json_utils.dumps_str(snapshot)}\n\n"
+
+        return Response(
+            stream(),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.get("/api/jobs/<job_id>/csv")
+    def api_job_csv(job_id: str):
+        job = get_job(job_id)
+        if job is None:
+            abort(404)
+        if job.status != JOB_DONE or not job.run_id:
+            return jsonify(job.to_dict()), 409
+        try:
+            csv_path = get_csv_path(job.run_id)
+        except FileNotFoundError:
+            abort(404)
+        return send_file(
+            str(csv_path),
+            mimetype="text/csv",
+            as_attachment=True,
+            download_name=f"{Path(job.source_name).stem}_cards.csv",
+            conditional=True,
+        )
+
     @app.get("/review")
     def review_index():
         return render_template("review.html")
@@ -181,22 +306,25 @@ def create_app() -> Flask:
         if threshold is None:
             threshold = float(os.getenv("POKEDATA_CONFIDENCE_THRESHOLD", "0.9"))
         try:
-            entries = low_confidence_entries(run_id, threshold=threshold)
+            load_run(run_id)  # 404 before the streamed body starts
         except FileNotFoundError:
             abort(404)
         base_url = url_for("review_image", run_id=run_id, image_name="", _external=False)
         base_url = base_url.rstrip("/")
-        enriched = []
-        for entry in entries:
-            image_name = entry.get("image")
-            image_url = f"{base_url}/{image_name}" if image_name else None
-            enriched.append(
-                {
-                    **entry,
-                    "image_url": image_url,
-                }
-            )
-        return jsonify({"items": enriched, "threshold": threshold})
+
+        def generate():
+            # Encode one item at a time so large runs never hold the whole
+            # response body in memory.
+            yield b'{"threshold":' + json_utils.dumps(threshold) + b',"items":['
+            for idx, entry in enumerate(low_confidence_entries(run_id, threshold=threshold)):
+                image_name = entry.get("image")
+                entry["image_url"] = f"{base_url}/{image_name}" if image_name else None
+                if idx:
+                    yield b","
+                yield json_utils.dumps(entry)
+            yield b"]}"
+
+        return Response(generate(), mimetype="application/json")
 
     @app.post("/api/runs/<run_id>/feedback")
     def api_feedback(run_id: str):
@@ -209,7 +337,7 @@ def create_app() -> Flask:
             abort(400)
         if action == "save" and not payload.get("value"):
             abort(400)
-        payload["timestamp"] = datetime.utcnow().isoformat()
+        payload["timestamp"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
         feedback_path = append_feedback(run_id, payload)
         logger.info("Human feedback recorded at %s", feedback_path)
         return jsonify({"status": "ok"})
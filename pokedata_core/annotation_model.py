@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
-import statistics
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import numpy as np
+
+from . import json_utils
 from .logging_utils import get_logger
 
 
@@ -15,10 +17,16 @@ logger = get_logger("annotation")
 
 OUTPUTS_DIR = Path(__file__).resolve().parent.parent / "Outputs"
 MODEL_PATH = OUTPUTS_DIR / "layout_model.json"
+READ_WORKERS = 8
+
+BoxTuple = Tuple[float, float, float, float]
 
 
 @dataclass
 class Box:
+    # Declared by hand: dataclass(slots=True) needs Python 3.10.
+    __slots__ = ("x", "y", "w", "h")
+
     x: float
     y: float
     w: float
@@ -41,44 +49,45 @@ def _collect_annotation_files(root: Path) -> Iterable[Path]:
             yield from ann_dir.glob("*.json")
 
 
+def _read_annotation_file(ann_path: Path) -> Optional[List[Dict[str, Any]]]:
+    try:
+        return json_utils.loads(ann_path.read_bytes())
+    except json_utils.JSONDecodeError:
+        logger.warning("Skipping invalid annotation file %s", ann_path)
+        return None
+
+
+def _box_tuple(data: Dict[str, float]) -> BoxTuple:
+    return float(data["x"]), float(data["y"]), float(data["w"]), float(data["h"])
+
+
 def build_layout_model(outputs_dir: Optional[Path] = None) -> Dict[str, Dict[str, float]]:
     root = outputs_dir or OUTPUTS_DIR
-    boxes: Dict[str, List[Box]] = {}
+    boxes: Dict[str, List[BoxTuple]] = {}
     total_annotations = 0
-    for ann_path in _collect_annotation_files(root):
-        try:
-            data = json.loads(ann_path.read_text())
-        except json.JSONDecodeError:
-            logger.warning("Skipping invalid annotation file %s", ann_path)
-            continue
-        for entry in data or []:
-            label = entry.get("label")
-            box = entry.get("box")
-            if not label or not box:
-                continue
-            try:
-                boxes.setdefault(label, []).append(Box.from_dict(box))
-                total_annotations += 1
-            except Exception:
-                logger.exception("Failed to parse annotation %s", ann_path)
+    ann_paths = list(_collect_annotation_files(root))
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        for ann_path, data in zip(ann_paths, pool.map(_read_annotation_file, ann_paths)):
+            for entry in data or []:
+                label = entry.get("label")
+                box = entry.get("box")
+                if not label or not box:
+                    continue
+                try:
+                    boxes.setdefault(label, []).append(_box_tuple(box))
+                    total_annotations += 1
+                except Exception:
+                    logger.exception("Failed to parse annotation %s", ann_path)
     if not boxes:
         logger.warning("No annotations found when building layout model")
         return {}
 
     model: Dict[str, Dict[str, float]] = {}
     for label, entries in boxes.items():
-        xs = [b.x for b in entries]
-        ys = [b.y for b in entries]
-        ws = [b.w for b in entries]
-        hs = [b.h for b in entries]
-        model[label] = {
-            "x": statistics.mean(xs),
-            "y": statistics.mean(ys),
-            "w": statistics.mean(ws),
-            "h": statistics.mean(hs),
-        }
+        x, y, w, h = np.asarray(entries, dtype=np.float64).mean(axis=0)
+        model[label] = {"x": float(x), "y": float(y), "w": float(w), "h": float(h)}
     MODEL_PATH.parent.mkdir(parents=True, exist_ok=True)
-    MODEL_PATH.write_text(json.dumps(model, indent=2))
+    MODEL_PATH.write_bytes(json_utils.dumps(model, indent=True))
     logger.info("Built layout model with %d labels (%d annotations)", len(model), total_annotations)
     return model
 
@@ -88,12 +97,12 @@ def load_layout_model(path: Optional[Path] = None) -> Dict[str, Dict[str, float]
     if not model_path.exists():
         return {}
     try:
-        return json.loads(model_path.read_text())
-    except json.JSONDecodeError:
+        return json_utils.loads(model_path.read_bytes())
+    except json_utils.JSONDecodeError:
         logger.warning("Layout model file %s is invalid", model_path)
         return {}
 
 
 if __name__ == "__main__":  # pragma: no cover - simple CLI helper
     model = build_layout_model()
-    print(json.dumps(model, indent=2))
+    print(json_utils.dumps_str(model, indent=True))
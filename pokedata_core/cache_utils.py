@@ -0,0 +1,37 @@
+"""On-disk result caches shared by the pipeline and the remote OCR modules."""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from . import json_utils
+
+# POKEDATA_NO_CACHE=1 bypasses every result cache below CACHE_ROOT.
+CACHE_ENABLED = os.getenv("POKEDATA_NO_CACHE", "0") != "1"
+CACHE_ROOT = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "pokedata"
+
+
+def cache_dir(name: str) -> Path:
+    """Directory of the ``name`` cache (created on first write)."""
+
+    return CACHE_ROOT / name
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Write ``data`` as JSON to ``path`` so readers never see a partial file.
+
+    The bytes go to a temp file unique to this process and thread, which is
+    then renamed over ``path``. Raises ``OSError`` on failure.
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(json_utils.dumps(data))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
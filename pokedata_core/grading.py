@@ -2,86 +2,166 @@
 
 from __future__ import annotations
 
+import functools
+import heapq
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional
 
 import numpy as np
 
-try:
-    import cv2  # type: ignore
-    import easyocr  # type: ignore
-    import requests  # type: ignore
+from .logging_utils import get_logger
+
+
+logger = get_logger("grading")
+
+# OpenCV and EasyOCR (which drags in PyTorch) are imported on first use so
+# processes that never grade a card don't pay for them. ``None`` = not tried yet.
+cv2: Any = None
+easyocr: Any = None
+_HAS_EASYOCR: Optional[bool] = None
+
+# Only the largest few label-shaped regions are worth an EasyOCR pass.
+GRADE_CANDIDATES = 5
+
+# Load the EasyOCR weights at startup instead of on the first graded card.
+GRADING_PRELOAD = os.getenv("POKEDATA_ENABLE_GRADING", "0") == "1"
+
+
+def _ensure_imports() -> bool:
+    """Import the grading dependencies once; return whether they are available."""
+
+    global cv2, easyocr, _HAS_EASYOCR
+    if _HAS_EASYOCR is None:
+        try:
+            import cv2 as _cv2  # type: ignore
+            import easyocr as _easyocr  # type: ignore
+        except ImportError as exc:
+            logger.info("Grading disabled; optional dependency missing: %s", exc)
+            _HAS_EASYOCR = False
+        else:
+            cv2, easyocr = _cv2, _easyocr
+            _HAS_EASYOCR = True
+    return _HAS_EASYOCR
+
 
-    _HAS_EASYOCR = True
-    _READER = None
-except Exception:  # pragma: no cover - optional dependency
-    _HAS_EASYOCR = False
-    _READER = None
+@functools.lru_cache(maxsize=1)
+def init_reader():
+    """Return the process-wide EasyOCR reader, constructing it on first use.
+
+    Under ``gunicorn --preload`` the reader is built in the parent so forked
+    workers share the weights copy-on-write.
+    """
+
+    _ensure_imports()
+    import torch  # type: ignore  # installed alongside easyocr
+
+    return easyocr.Reader(["en"], gpu=torch.cuda.is_available(), quantize=True)
+
+
+def preload_reader() -> bool:
+    """Warm the EasyOCR reader when grading is available; return success."""
+
+    if not _ensure_imports():
+        return False
+    try:
+        init_reader()
+    except Exception:  # pragma: no cover - model download/initialisation issues
+        logger.warning("EasyOCR reader preload failed", exc_info=True)
+        return False
+    logger.info("EasyOCR reader preloaded for grading")
+    return True
 
 
 def _get_reader():
-    global _READER
-    if _READER is None:
-        _READER = easyocr.Reader(["en"])
-    return _READER
+    return init_reader()
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session():
+    """Shared keep-alive session for fetching slab images by URL."""
+
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 def estimate_grade(image_path: Path, *, debug_dir: Optional[Path] = None, scale: float = 0.5) -> Optional[str]:
-    if not _HAS_EASYOCR:
+    if not _ensure_imports():
         return None
 
+    # Everything downstream is grayscale, so decode straight to one channel. At
+    # half scale let libjpeg/libpng also downsample during decode instead of
+    # decoding at full resolution and resizing afterwards.
+    reduced = scale == 0.5
+    flags = cv2.IMREAD_REDUCED_GRAYSCALE_2 if reduced else cv2.IMREAD_GRAYSCALE
+
     path = str(image_path)
     if path.startswith(("http://", "https://")):
         try:
-            response = requests.get(path, timeout=10)
-            response.raise_for_status()
-            data = np.frombuffer(response.content, np.uint8)
-            img = cv2.imdecode(data, cv2.IMREAD_COLOR)
+            with _http_session().get(path, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                data = np.frombuffer(response.raw.read(decode_content=True), np.uint8)
+            img = cv2.imdecode(data, flags)
         except Exception:
             img = None
     else:
-        img = cv2.imread(path)
+        img = cv2.imread(path, flags)
 
     if img is None:
         return None
 
-    img = cv2.resize(img, (int(img.shape[1] * scale), int(img.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+    if not reduced and scale != 1.0:
+        img = cv2.resize(img, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
     h, _ = img.shape[:2]
 
-    top_crop = img[: int(h * 0.3), :]
-    gray = cv2.cvtColor(top_crop, cv2.COLOR_BGR2GRAY)
+    gray = img[: int(h * 0.3), :]
     _, thresh = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY)
     contours, _ = cv2.findContours(thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-    contours = [cv2.boundingRect(cnt) for cnt in contours]
-    contours.sort(key=lambda r: r[2] * r[3], reverse=True)
-
-    if debug_dir:
-        debug_dir.mkdir(parents=True, exist_ok=True)
-
-    reader = _get_reader()
-
-    for idx, (x, y, w_rect, h_rect) in enumerate(contours):
-        if w_rect * h_rect < 500 or w_rect < 20 or h_rect < 10:
+    # Filter and keep the top-K by area in one pass instead of sorting every rect.
+    candidates = []
+    for cnt in contours:
+        x, y, w_rect, h_rect = cv2.boundingRect(cnt)
+        area = w_rect * h_rect
+        if area < 500 or w_rect < 20 or h_rect < 10:
             continue
         aspect_ratio = w_rect / h_rect
         if aspect_ratio < 2.5 or aspect_ratio > 5:
             continue
+        if len(candidates) < GRADE_CANDIDATES:
+            heapq.heappush(candidates, (area, x, y, w_rect, h_rect))
+        else:
+            heapq.heappushpop(candidates, (area, x, y, w_rect, h_rect))
+
+    if debug_dir:
+        debug_dir.mkdir(parents=True, exist_ok=True)
 
+    crops = []
+    for idx, (_, x, y, w_rect, h_rect) in enumerate(sorted(candidates, reverse=True)):
         grade_crop = gray[y : y + h_rect, x : x + w_rect]
         if debug_dir:
             cv2.imwrite(str(debug_dir / f"crop_{idx}.png"), grade_crop)
 
         h_crop, w_crop = grade_crop.shape
-        focused_crop = grade_crop[int(h_crop * 0.3) :, int(w_crop * 0.7) :]
+        crops.append(grade_crop[int(h_crop * 0.3) :, int(w_crop * 0.7) :])
 
-        try:
-            result = reader.readtext(focused_crop)
-        except Exception:
-            continue
+    if not crops:
+        return None
 
-        for _, text, _ in result:
+    reader = _get_reader()
+    for texts in _read_crops(reader, crops):
+        for text in texts:
             text_upper = text.upper()
             if "GEM MT" in text_upper or "GEM" in text_upper:
                 return "10"
@@ -89,3 +169,33 @@ def estimate_grade(image_path: Path, *, debug_dir: Optional[Path] = None, scale:
                 return "9"
 
     return None
+
+
+def _read_crops(reader, crops: List[np.ndarray]) -> List[List[str]]:
+    """OCR every crop in one EasyOCR batch, returning the text lines per crop.
+
+    ``readtext_batched`` needs equally sized inputs, so crops are edge-padded to
+    the largest one rather than resized (which would distort the glyphs). If the
+    batched call fails, each crop is read on its own as before.
+    """
+
+    max_h = max(crop.shape[0] for crop in crops)
+    max_w = max(crop.shape[1] for crop in crops)
+    batch = [
+        cv2.copyMakeBorder(
+            crop, 0, max_h - crop.shape[0], 0, max_w - crop.shape[1], cv2.BORDER_REPLICATE
+        )
+        for crop in crops
+    ]
+    try:
+        return reader.readtext_batched(batch, batch_size=len(batch), detail=0)
+    except Exception:
+        logger.debug("Batched EasyOCR call failed; reading grade crops one at a time", exc_info=True)
+
+    results: List[List[str]] = []
+    for crop in crops:
+        try:
+            results.append(reader.readtext(crop, detail=0))
+        except Exception:
+            results.append([])
+    return results
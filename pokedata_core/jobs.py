@@ -0,0 +1,176 @@
+"""In-process background queue for long-running OCR jobs."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from .logging_utils import get_logger
+from .pipeline import process_to_csv
+from .review_store import store_run
+from .upload_pool import release_workdir
+
+
+logger = get_logger("jobs")
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+FINISHED_STATES = {JOB_DONE, JOB_FAILED}
+
+try:
+    JOB_WORKERS = max(1, int(os.getenv("POKEDATA_JOB_WORKERS", "1")))
+except (TypeError, ValueError):
+    JOB_WORKERS = 1
+
+# Finished jobs stay pollable for a while, then are dropped so a long-running
+# server does not keep every Job (and its Condition) it ever created.
+try:
+    JOB_TTL_SECONDS = max(0.0, float(os.getenv("POKEDATA_JOB_TTL", "3600")))
+except (TypeError, ValueError):
+    JOB_TTL_SECONDS = 3600.0
+MAX_FINISHED_JOBS = 256
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="pokedata-job")
+_JOBS: Dict[str, "Job"] = {}
+_JOBS_LOCK = threading.Lock()
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+@dataclass
+class Job:
+    job_id: str
+    source_name: str
+    status: str = JOB_QUEUED
+    run_id: Optional[str] = None
+    rows: int = 0
+    pages_done: int = 0
+    pages_total: int = 0
+    error: Optional[str] = None
+    created_at: str = field(default_factory=_now)
+    updated_at: str = field(default_factory=_now)
+    version: int = 0
+    finished_at: Optional[float] = field(default=None, repr=False)  # time.monotonic()
+    _changed: threading.Condition = field(default_factory=threading.Condition, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "source_name": self.source_name,
+            "status": self.status,
+            "run_id": self.run_id,
+            "rows": self.rows,
+            "pages_done": self.pages_done,
+            "pages_total": self.pages_total,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+    def update(self, **changes: Any) -> None:
+        with self._changed:
+            for key, value in changes.items():
+                setattr(self, key, value)
+            self.updated_at = _now()
+            self.version += 1
+            self._changed.notify_all()
+
+
+def submit_job(
+    input_path: Path, source_name: str, *, dpi: int = 300, limit: int = 0
+) -> Job:
+    """Queue ``input_path`` for processing and return the tracking job.
+
+    The job owns ``input_path.parent``: the staging directory is returned to the
+    upload pool once the run has been stored (or has failed).
+    """
+
+    job = Job(job_id=uuid.uuid4().hex, source_name=source_name)
+    with _JOBS_LOCK:
+        _prune_finished_jobs()
+        _JOBS[job.job_id] = job
+    _EXECUTOR.submit(_run_job, job, input_path, dpi, limit)
+    logger.info("Queued job %s for %s (dpi=%s, limit=%s)", job.job_id, source_name, dpi, limit)
+    return job
+
+
+def get_job(job_id: str) -> Optional[Job]:
+    with _JOBS_LOCK:
+        _prune_finished_jobs()
+        return _JOBS.get(job_id)
+
+
+def _prune_finished_jobs() -> None:
+    """Drop finished jobs past the TTL, and the oldest beyond MAX_FINISHED_JOBS.
+
+    Callers hold ``_JOBS_LOCK``.
+    """
+
+    finished = sorted(
+        (job.finished_at, job_id)
+        for job_id, job in _JOBS.items()
+        if job.finished_at is not None
+    )
+    cutoff = time.monotonic() - JOB_TTL_SECONDS
+    excess = len(finished) - MAX_FINISHED_JOBS
+    for position, (finished_at, job_id) in enumerate(finished):
+        if finished_at > cutoff and position >= excess:
+            break
+        del _JOBS[job_id]
+
+
+def iter_job_events(job: Job, keepalive: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield job snapshots whenever the job changes, ``None`` on idle keepalives.
+
+    The iterator ends after the job reaches a finished state.
+    """
+
+    seen = -1
+    while True:
+        with job._changed:
+            if job.version == seen:
+                job._changed.wait(timeout=keepalive)
+            if job.version == seen:
+                snapshot = None
+            else:
+                seen = job.version
+                snapshot = job.to_dict()
+        yield snapshot
+        if snapshot is not None and snapshot["status"] in FINISHED_STATES:
+            return
+
+
+def _run_job(job: Job, input_path: Path, dpi: int, limit: int) -> None:
+    staging_dir = input_path.parent
+    job.update(status=JOB_RUNNING)
+
+    def _progress(done: int, total: int) -> None:
+        job.update(pages_done=done, pages_total=total)
+
+    try:
+        output_csv = staging_dir / f"{input_path.stem}_cards.csv"
+        result = process_to_csv(input_path, output_csv, limit=limit, dpi=dpi, progress=_progress)
+        run_meta = store_run(result, job.source_name)
+        job.update(
+            status=JOB_DONE,
+            run_id=run_meta.get("run_id"),
+            rows=len(result.rows),
+            finished_at=time.monotonic(),
+        )
+        logger.info("Job %s finished as run %s", job.job_id, job.run_id)
+    except Exception as exc:  # noqa: BLE001 - reported through the job status
+        logger.exception("Job %s failed for %s", job.job_id, job.source_name)
+        job.update(status=JOB_FAILED, error=str(exc), finished_at=time.monotonic())
+    finally:
+        release_workdir(staging_dir)
@@ -0,0 +1,47 @@
+"""Fast JSON helpers backed by orjson, with a stdlib fallback."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+
+    _HAS_ORJSON = True
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+    _HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception type.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Parse JSON from ``bytes`` (preferred; skips a str decode) or ``str``."""
+
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (non-ASCII kept as-is)."""
+
+    if _HAS_ORJSON:
+        # OPT_NON_STR_KEYS: stringify int/float/bool/None keys like json.dumps
+        # instead of raising (model payloads occasionally carry numeric keys).
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def dumps_str(obj: Any, *, indent: bool = False) -> str:
+    """Serialize ``obj`` to a JSON ``str``; equivalent to ``ensure_ascii=False``."""
+
+    return dumps(obj, indent=indent).decode("utf-8")
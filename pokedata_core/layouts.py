@@ -2,13 +2,37 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+import numpy as np
 
 
 @dataclass(frozen=True)
 class Layout:
+    __slots__ = ("regions", "labels", "_arr")
+
     regions: Dict[str, tuple[float, float, float, float]]
+    labels: Tuple[str, ...] = field(init=False, compare=False)
+    _arr: np.ndarray = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "labels", tuple(self.regions))
+        # float64 so truncation matches the scalar ``int(box[i] * size)`` math.
+        object.__setattr__(
+            self, "_arr", np.array(list(self.regions.values()), dtype=np.float64).reshape(-1, 4)
+        )
+
+    def pixel_boxes(self, width: int, height: int) -> np.ndarray:
+        """Return an ``(N, 4)`` int array of ``(x0, y0, x1, y1)`` boxes clipped to the image.
+
+        Rows follow :attr:`labels`.
+        """
+
+        size = np.array([width, height, width, height], dtype=np.float64)
+        boxes = (self._arr * size).astype(np.int32)
+        np.clip(boxes, 0, size.astype(np.int32), out=boxes)
+        return boxes
 
 
 POKEMON_LAYOUT = Layout(
@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import multiprocessing
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 
 LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
 LOG_FILE = LOG_DIR / "pokedata.log"
 
+# One cross-process queue per context, drained into the parent's handlers.
+_WORKER_QUEUES: dict = {}
+_WORKER_QUEUES_LOCK = threading.Lock()
+
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """Configure the shared logger once and return it.
 
     The logs are written to ``logs/pokedata.log`` with basic rotation to prevent the
-    file from growing without bound.
+    file from growing without bound. Records are handed to a background
+    ``QueueListener`` so callers never block on file writes or rotation.
     """
 
     logger = logging.getLogger("pokedata")
@@ -38,9 +47,13 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
     stream_handler.setFormatter(formatter)
     stream_handler.setLevel(logging.WARNING)
 
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     logger.setLevel(level)
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    logger.addHandler(QueueHandler(log_queue))
 
     logging.getLogger("pdf2image").setLevel(logging.WARNING)
     logging.getLogger("pytesseract").setLevel(logging.INFO)
@@ -56,3 +69,32 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
         return parent.getChild(name)
     return parent
 
+
+
+def worker_log_queue(mp_context: Any = None) -> Any:
+    """Return a queue that carries worker-process records to this process's log.
+
+    Pass it to :func:`install_worker_logging` as a process pool initializer. A
+    forked worker otherwise inherits a ``QueueHandler`` whose in-memory queue
+    has no listener in the child, so its records are silently dropped.
+    """
+
+    ctx = mp_context or multiprocessing.get_context()
+    with _WORKER_QUEUES_LOCK:
+        log_queue = _WORKER_QUEUES.get(ctx.get_start_method())
+        if log_queue is None:
+            log_queue = ctx.Queue()
+            listener = QueueListener(log_queue, *setup_logging().handlers)
+            listener.start()
+            atexit.register(listener.stop)
+            _WORKER_QUEUES[ctx.get_start_method()] = log_queue
+    return log_queue
+
+
+def install_worker_logging(log_queue: Any) -> None:
+    """Process pool initializer: send this worker's records to ``log_queue``."""
+
+    logger = setup_logging()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
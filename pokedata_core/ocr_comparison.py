@@ -6,8 +6,10 @@ performance metrics, and accuracy measurements.
 
 from __future__ import annotations
 
+import os
 import time
-from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from PIL import Image
 
 from . import remote_ocr  # v1.0
@@ -17,6 +19,33 @@ from .logging_utils import get_logger
 
 logger = get_logger("ocr_comparison")
 
+_FIELDS = ("name", "hp", "evolves_from", "card_type", "set_name", "card_number", "artist")
+
+try:
+    COMPARE_WORKERS = max(1, int(os.getenv("POKEDATA_COMPARE_WORKERS", str(os.cpu_count() or 1))))
+except (TypeError, ValueError):
+    COMPARE_WORKERS = os.cpu_count() or 1
+
+# v2.0 runs here while v1.0 runs on the calling thread; sized so that every
+# batch_compare worker can have its v2.0 call in flight at the same time.
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, COMPARE_WORKERS), thread_name_prefix="ocr-compare")
+
+
+def _timed_extract(
+    label: str, extract: Callable[[Image.Image], Dict], pil_image: Image.Image
+) -> Tuple[Dict, Optional[str], float]:
+    """Run one pipeline and return ``(results, error, wall_seconds)``."""
+    logger.debug("Running %s pipeline...", label)
+    start = time.perf_counter()
+    try:
+        results = extract(pil_image)
+        error = None
+    except Exception as e:
+        logger.warning("%s extraction failed: %s", label, e)
+        results = {}
+        error = str(e)
+    return results, error, time.perf_counter() - start
+
 
 def compare_extraction(pil_image: Image.Image) -> Tuple[Dict, Dict, Dict]:
     """
@@ -35,39 +64,25 @@ def compare_extraction(pil_image: Image.Image) -> Tuple[Dict, Dict, Dict]:
     """
     logger.info("Starting A/B comparison")
 
-    # Run v1.0
-    logger.debug("Running v1.0 pipeline...")
-    start_v1 = time.time()
-    try:
-        v1_results = remote_ocr.extract_card_fields(pil_image)
-        v1_error = None
-    except Exception as e:
-        logger.warning("v1.0 extraction failed: %s", e)
-        v1_results = {}
-        v1_error = str(e)
-    v1_time = time.time() - start_v1
-
-    # Run v2.0
-    logger.debug("Running v2.0 pipeline...")
-    start_v2 = time.time()
-    try:
-        v2_results = remote_ocr_v2.extract_card_fields_v2(pil_image)
-        v2_error = None
-    except Exception as e:
-        logger.warning("v2.0 extraction failed: %s", e)
-        v2_results = {}
-        v2_error = str(e)
-    v2_time = time.time() - start_v2
+    # Both pipelines are bound by remote API latency, so run them side by side.
+    v2_future = _EXECUTOR.submit(
+        _timed_extract, "v2.0", remote_ocr_v2.extract_card_fields_v2, pil_image
+    )
+    v1_results, v1_error, v1_time = _timed_extract(
+        "v1.0", remote_ocr.extract_card_fields, pil_image
+    )
+    v2_results, v2_error, v2_time = v2_future.result()
 
     # Compare results
+    field_comp = _compare_fields(v1_results, v2_results)
     comparison = {
         "v1_time_seconds": v1_time,
         "v2_time_seconds": v2_time,
         "time_delta": v1_time - v2_time,  # Positive = v2 faster
         "v1_error": v1_error,
         "v2_error": v2_error,
-        "field_comparison": _compare_fields(v1_results, v2_results),
-        "summary": _generate_summary(v1_results, v2_results, v1_time, v2_time, v1_error, v2_error)
+        "field_comparison": field_comp,
+        "summary": _generate_summary(field_comp, v1_time, v2_time, v1_error, v2_error)
     }
 
     logger.info(
@@ -96,10 +111,9 @@ def _compare_fields(v1: Dict, v2: Dict) -> Dict[str, Dict]:
             ...
         }
     """
-    fields = ["name", "hp", "evolves_from", "card_type", "set_name", "card_number", "artist"]
     comparison = {}
 
-    for field in fields:
+    for field in _FIELDS:
         v1_val = v1.get(field, "").strip().lower()
         v2_val = v2.get(field, "").strip().lower()
 
@@ -117,11 +131,9 @@ def _compare_fields(v1: Dict, v2: Dict) -> Dict[str, Dict]:
     return comparison
 
 
-def _generate_summary(v1: Dict, v2: Dict, v1_time: float, v2_time: float,
+def _generate_summary(field_comp: Dict[str, Dict], v1_time: float, v2_time: float,
                       v1_error: str, v2_error: str) -> Dict:
-    """Generate high-level comparison summary."""
-    field_comp = _compare_fields(v1, v2)
-
+    """Generate high-level comparison summary from ``_compare_fields`` output."""
     matches = sum(1 for fc in field_comp.values() if fc["match"])
     total_fields = len(field_comp)
 
@@ -170,16 +182,31 @@ def batch_compare(image_paths: List[str]) -> Dict:
         "detailed_results": []
     }
 
-    for i, img_path in enumerate(image_paths, 1):
-        logger.info("Processing %d/%d: %s", i, len(image_paths), img_path)
+    total = len(image_paths)
+
+    def compare_one(item: Tuple[int, str]) -> Optional[Tuple[str, Dict, Dict, Dict]]:
+        i, img_path = item
+        logger.info("Processing %d/%d: %s", i, total, img_path)
 
         try:
             pil_img = Image.open(img_path).convert("RGB")
         except Exception as e:
             logger.error("Failed to load image %s: %s", img_path, e)
-            continue
+            return None
 
         v1_res, v2_res, comp = compare_extraction(pil_img)
+        return img_path, v1_res, v2_res, comp
+
+    with ThreadPoolExecutor(
+        max_workers=min(COMPARE_WORKERS, max(1, total)), thread_name_prefix="ocr-batch"
+    ) as executor:
+        outcomes = list(executor.map(compare_one, enumerate(image_paths, 1)))
+
+    # Aggregate on this thread once every comparison is in; no locking needed.
+    for outcome in outcomes:
+        if outcome is None:
+            continue
+        img_path, v1_res, v2_res, comp = outcome
 
         # Track errors
         if comp["v1_error"]:
@@ -0,0 +1,210 @@
+"""Tesseract text recognition, in-process via tesserocr when available.
+
+``pytesseract`` launches a ``tesseract`` process and reloads the language model
+for every crop. When :mod:`tesserocr` is installed a ``PyTessBaseAPI`` is kept
+per thread (the API is not thread-safe) and reused for every call; otherwise the
+pytesseract subprocess path is used unchanged.
+"""
+
+from __future__ import annotations
+
+import functools
+import shlex
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pytesseract
+from PIL import Image
+from pytesseract import Output
+
+from .logging_utils import get_logger
+
+try:
+    import tesserocr  # type: ignore
+
+    _HAS_TESSEROCR = True
+except Exception:  # pragma: no cover - optional dependency
+    tesserocr = None  # type: ignore
+    _HAS_TESSEROCR = False
+
+
+logger = get_logger("ocr_engine")
+
+_LOCAL = threading.local()
+_INIT_FAILED = False
+
+
+def build_tesseract_config(args: Sequence[str]) -> str:
+    """Return a shell-safe config string for pytesseract.
+
+    pytesseract's ``config`` parameter is a string that is split with
+    :func:`shlex.split` internally.  Any raw single quotes therefore start a
+    quoted segment which raises ``ValueError('No closing quotation')`` unless
+    they are escaped.  We expand single quotes using the standard POSIX
+    ``'"'"'`` pattern so that the downstream splitter reconstructs the original
+    argument verbatim.
+    """
+
+    escaped: list[str] = []
+    for arg in args:
+        if "'" in arg:
+            escaped.append("'" + arg.replace("'", "'\"'\"'") + "'")
+        else:
+            escaped.append(shlex.quote(arg))
+    return " ".join(escaped)
+
+
+def _thread_api(lang: str):
+    """Return this thread's ``PyTessBaseAPI`` for ``lang`` or ``None`` if unusable."""
+
+    global _INIT_FAILED
+    if not _HAS_TESSEROCR or _INIT_FAILED:
+        return None
+    apis: Optional[Dict[str, object]] = getattr(_LOCAL, "apis", None)
+    if apis is None:
+        apis = _LOCAL.apis = {}
+    api = apis.get(lang)
+    if api is None:
+        try:
+            api = tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM.SINGLE_BLOCK)
+        except Exception:  # pragma: no cover - missing tessdata etc.
+            logger.warning("tesserocr init failed; using the tesseract CLI", exc_info=True)
+            _INIT_FAILED = True
+            return None
+        apis[lang] = api
+    return api
+
+
+def uses_tesserocr() -> bool:
+    """Whether OCR runs in-process (so batching crops into one call buys nothing)."""
+
+    return _HAS_TESSEROCR and not _INIT_FAILED
+
+
+def ocr_text(
+    image: Image.Image,
+    *,
+    psm: int = 6,
+    whitelist: Optional[str] = None,
+    lang: str = "eng",
+) -> str:
+    """Recognise the text in ``image``.
+
+    Raises ``pytesseract.TesseractNotFoundError`` when neither tesserocr nor the
+    tesseract binary is available, like the pytesseract calls it replaces.
+    """
+
+    api = _thread_api(lang)
+    if api is not None:
+        _prepare(api, image, psm, whitelist)
+        return api.GetUTF8Text()
+
+    return pytesseract.image_to_string(
+        image, lang=lang, config=_cli_config(psm, whitelist)
+    )
+
+
+@dataclass
+class OcrTokens:
+    """Recognised words as parallel columns (one entry per non-empty word).
+
+    ``bbox`` entries are ``(left, top, width, height)``.
+    """
+
+    __slots__ = ("text", "confidence", "bbox")
+
+    text: List[str]
+    confidence: List[float]
+    bbox: List[Tuple[int, int, int, int]]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+
+def ocr_tokens(
+    image: Image.Image,
+    *,
+    psm: int = 6,
+    whitelist: Optional[str] = None,
+    lang: str = "eng",
+) -> OcrTokens:
+    """Recognise the words in ``image``; empty words are dropped.
+
+    Raises like :func:`ocr_text` when no Tesseract is available.
+    """
+
+    tokens = OcrTokens([], [], [])
+    api = _thread_api(lang)
+    if api is not None:
+        _prepare(api, image, psm, whitelist)
+        api.Recognize()
+        iterator = api.GetIterator()
+        if iterator is None:
+            return tokens
+        level = tesserocr.RIL.WORD
+        for word in tesserocr.iterate_level(iterator, level):
+            try:
+                text = (word.GetUTF8Text(level) or "").strip()
+            except RuntimeError:  # no text at this position
+                continue
+            box = word.BoundingBox(level)
+            if not text or box is None:
+                continue
+            left, top, right, bottom = box
+            tokens.text.append(text)
+            tokens.confidence.append(float(word.Confidence(level)))
+            tokens.bbox.append((left, top, right - left, bottom - top))
+        return tokens
+
+    data = pytesseract.image_to_data(
+        image,
+        lang=lang,
+        output_type=Output.DICT,
+        config=_cli_config(psm, whitelist),
+    )
+    # image_to_data already returns parallel columns; keep the non-empty rows.
+    rows = zip(
+        data.get("text", []),
+        data.get("conf", []),
+        data.get("left", []),
+        data.get("top", []),
+        data.get("width", []),
+        data.get("height", []),
+    )
+    for raw, conf, left, top, width, height in rows:
+        text = str(raw).strip()
+        if not text:
+            continue
+        try:
+            conf_val = float(conf)
+        except (ValueError, TypeError):
+            conf_val = 0.0
+        tokens.text.append(text)
+        tokens.confidence.append(conf_val)
+        tokens.bbox.append((int(left), int(top), int(width), int(height)))
+    return tokens
+
+
+def _prepare(api, image: Image.Image, psm: int, whitelist: Optional[str]) -> None:
+    # Forget what the adaptive classifier learned from the previous crop, so a
+    # reused handle reads each image like a fresh tesseract process would.
+    api.ClearAdaptiveClassifier()
+    api.SetPageSegMode(psm)
+    api.SetVariable("tessedit_char_whitelist", whitelist or "")
+    if image.mode == "L":
+        # Hand over the raw 8-bit buffer; SetImage would re-encode the image.
+        width, height = image.size
+        api.SetImageBytes(image.tobytes(), width, height, 1, width)
+    else:
+        api.SetImage(image)
+
+
+@functools.lru_cache(maxsize=None)
+def _cli_config(psm: int, whitelist: Optional[str]) -> str:
+    # Only a handful of (psm, whitelist) pairs exist, so each quoted config
+    # string is built once.
+    args = ["--psm", str(psm)]
+    if whitelist:
+        args += ["-c", f"tessedit_char_whitelist={whitelist}"]
+    return build_tesseract_config(args)
@@ -7,34 +7,59 @@ script and the web application.
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import json
+import multiprocessing
 import os
 import re
 import shutil
+import subprocess
+import tempfile
 import unicodedata as ud
-from dataclasses import dataclass, field, asdict
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields as dataclass_fields
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern, Sequence, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 import pytesseract
 from PIL import Image, ImageFilter, ImageOps
 
+from . import cache_utils, json_utils
 from .annotation_model import load_layout_model
-from .grading import estimate_grade
-from .logging_utils import get_logger
+from .grading import GRADING_PRELOAD, estimate_grade, preload_reader
+from .logging_utils import get_logger, install_worker_logging, worker_log_queue
+from .ocr_engine import ocr_text, uses_tesserocr
 from .remote_ocr import extract_card_fields
 from .region_cropper import (
     CroppedRegions,
     crop_regions,
     detect_layout,
-    extract_bottom_text,
     extract_hp,
-    extract_title_text,
+    extract_region_texts,
 )
 
 try:
-    from pdf2image import convert_from_path  # requires Poppler installed on system
+    # requires Poppler installed on system
+    from pdf2image import pdfinfo_from_path
 
     _HAS_PDF2IMAGE = True
 except Exception:  # pragma: no cover - best effort import
@@ -47,11 +72,41 @@ try:
 except Exception:  # pragma: no cover - best effort import
     _HAS_CV2 = False
 
+try:
+    import re2  # type: ignore  # google-re2: linear-time DFA matching
+
+    _HAS_RE2 = True
+except Exception:  # pragma: no cover - optional dependency
+    _HAS_RE2 = False
+
+try:
+    import blake3  # type: ignore
+
+    _HAS_BLAKE3 = True
+except Exception:  # pragma: no cover - optional dependency
+    _HAS_BLAKE3 = False
+
 # Feature flags
 USE_DESKEW = True
+# The skew angle survives uniform downscaling, so the Otsu mask is shrunk
+# before collecting its foreground points (findNonZero/minAreaRect would
+# otherwise walk millions of pixels on a full page).
+DESKEW_SAMPLE_SCALE = 0.25
 SAVE_DEBUG = False
 MAX_OCR_CHARS = 10000
 AUTO_CROP_ENABLED = os.getenv("POKEDATA_AUTO_CROP", "0") == "1"
+# pdftoppm JPEG quality for rendered PDF pages; high enough that OCR is unaffected.
+PDF_JPEG_QUALITY = 92
+# Contiguous PDF pages per pdftoppm process, and how many of those run at once.
+PDF_RENDER_CHUNK = 4
+PDF_RENDER_WORKERS = os.cpu_count() or 1
+CSV_WRITE_BUFFER = 1 << 20
+# Tesseract gains nothing from more than ~300 dpi worth of glyph pixels, so
+# oversized scans are shrunk before OCR (0 disables).
+try:
+    OCR_MAX_DIM = max(0, int(os.getenv("POKEDATA_OCR_MAX_DIM", "2400")))
+except (TypeError, ValueError):
+    OCR_MAX_DIM = 2400
 
 CARD_TYPE_POKEMON = "pokemon"
 CARD_TYPE_TRAINER = "trainer"
@@ -61,10 +116,97 @@ CARD_TYPE_UNKNOWN = "unknown"
 # Set code mapping placeholder. Add entries as you discover them.
 SET_CODE_MAP: Dict[str, str] = {}
 
+# Called as ``progress(pages_done, pages_total)`` after each processed page.
+ProgressCallback = Callable[[int, int], None]
+
 
 logger = get_logger("pipeline")
 LAYOUT_MODEL = load_layout_model()
+
+
+def _clamp01(value: float) -> float:
+    return max(0.0, min(1.0, value))
+
+
+def _precompute_layout_boxes(
+    model: Dict[str, Dict[str, float]]
+) -> List[Tuple[str, float, float, float, float]]:
+    """Turn the layout model into clamped ``(label, left, top, right, bottom)`` fractions."""
+
+    boxes: List[Tuple[str, float, float, float, float]] = []
+    for label, box in (model or {}).items():
+        try:
+            x = float(box.get("x", 0.0))
+            y = float(box.get("y", 0.0))
+            w = float(box.get("w", 0.0))
+            h = float(box.get("h", 0.0))
+        except Exception:
+            logger.exception("Invalid layout model box for label %s", label)
+            continue
+        boxes.append((label, _clamp01(x), _clamp01(y), _clamp01(x + w), _clamp01(y + h)))
+    return boxes
+
+
+_LAYOUT_BOXES = _precompute_layout_boxes(LAYOUT_MODEL)
+_LAYOUT_LABELS = tuple(box[0] for box in _LAYOUT_BOXES)
+
+# Per-page results cached by page-file hash; POKEDATA_NO_CACHE=1 bypasses it.
+PAGE_CACHE_ENABLED = cache_utils.CACHE_ENABLED
+PAGE_CACHE_DIR = cache_utils.cache_dir("pages")
+# Bump when a code or schema change alters what a page produces, so results
+# cached by older code are not served.
+RESULTS_VERSION = 1
+# Settings that change a page's result. Secrets and tuning knobs (API key,
+# worker counts, TTLs, cache sizes) are left out so they never bust caches.
+OUTPUT_SETTINGS = (
+    "POKEDATA_REMOTE_OCR",
+    "POKEDATA_OPENAI_MODEL",
+    "POKEDATA_FRONT_ONLY",
+    "POKEDATA_OCR_MAX_DIM",
+    "POKEDATA_REMOTE_FULL_IMAGE",
+    "POKEDATA_REMOTE_CONFIDENCE_THRESHOLD",
+    "POKEDATA_AUTO_CROP",
+    "POKEDATA_ENABLE_GRADING",
+)
+
+
+def settings_fingerprint() -> str:
+    """Short hash of ``RESULTS_VERSION`` and the current ``OUTPUT_SETTINGS`` values."""
+
+    settings = [(name, os.getenv(name)) for name in OUTPUT_SETTINGS]
+    return hashlib.blake2b(
+        repr((RESULTS_VERSION, settings)).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
+
+# Results depend on the output settings and the layout model as well as the
+# page, so both are folded into the cache file name.
+_PAGE_CACHE_SALT = hashlib.blake2b(
+    repr(
+        (
+            settings_fingerprint(),
+            sorted(LAYOUT_MODEL.items()) if LAYOUT_MODEL else (),
+        )
+    ).encode("utf-8"),
+    digest_size=8,
+).hexdigest()
+# Warnings from transient failures (network, missing tesseract, a crashed
+# worker); rows carrying them must not be cached.
+_TRANSIENT_WARNINGS = (
+    "remote_error:",
+    "tesseract_missing",
+    "layout_error:",
+    "crop_error:",
+    "exception:",
+)
 REMOTE_OCR_ENABLED = os.getenv("POKEDATA_REMOTE_OCR", "1") != "0"
+# Optional card image pushed through ``process_page`` once at startup.
+WARMUP_IMAGE = os.getenv("POKEDATA_WARMUP_IMAGE", "")
+try:
+    PAGE_WORKERS = max(1, int(os.getenv("POKEDATA_WORKERS", str(os.cpu_count() or 1))))
+except (TypeError, ValueError):
+    PAGE_WORKERS = os.cpu_count() or 1
+_READY = False
 try:
     REMOTE_LOW_CONFIDENCE_THRESHOLD = float(
         os.getenv("POKEDATA_REMOTE_CONFIDENCE_THRESHOLD", "0.45")
@@ -88,19 +230,46 @@ REMOTE_POINTER_FIELD_MAP = {
     "text.retreatCost": "retreat",
 }
 
-# Regexes & heuristics
-RE_HP = re.compile(r"\bHP\s*(\d{1,3})\b", re.IGNORECASE)
+
+def _compile_text_pattern(pattern: str, ignore_case: bool = False) -> Pattern[str]:
+    """Compile an OCR parsing pattern with RE2 when installed, else stdlib ``re``.
+
+    RE2 takes no ``re`` flags, so case-insensitivity is expressed as a scoped
+    ``(?i:...)`` group that both engines understand. Patterns RE2 rejects (e.g.
+    lookarounds) quietly stay on ``re``.
+    """
+
+    if ignore_case:
+        pattern = f"(?i:{pattern})"
+    if _HAS_RE2:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            logger.debug("RE2 cannot compile %r; using re", pattern)
+    return re.compile(pattern)
+
+
+# Regexes & heuristics (RE_SET_CODE needs a lookahead, so it stays on ``re``)
+RE_HP = _compile_text_pattern(r"\bHP\s*(\d{1,3})\b", ignore_case=True)
 RE_VALID_HP = re.compile(r"^\d{1,3}$")
-RE_EVOLVES = re.compile(r"\bEvolves\s+from\s+([A-Za-z0-9'\-. ]+)", re.IGNORECASE)
-RE_ARTIST = re.compile(r"\bIllus\.\s*([A-Za-z0-9'\-.\s]+)", re.IGNORECASE)
-RE_CARDNUM = re.compile(r"\b(\d{1,3}\s*/\s*\d{1,3})\b")
+RE_EVOLVES = _compile_text_pattern(r"\bEvolves\s+from\s+([A-Za-z0-9'\-. ]+)", ignore_case=True)
+RE_ARTIST = _compile_text_pattern(r"\bIllus\.\s*([A-Za-z0-9'\-.\s]+)", ignore_case=True)
+RE_CARDNUM = _compile_text_pattern(r"\b(\d{1,3}\s*/\s*\d{1,3})\b")
 RE_SET_CODE = re.compile(r"\b([A-Z]{2,4})\s*(?=\d{1,3}\s*/\s*\d{1,3})")
 RE_SET_CODE_STRICT = re.compile(r"^[A-Z]{2,4}$")
-RE_WEAKNESS = re.compile(r"\bweakness\b", re.IGNORECASE)
-RE_RESIST = re.compile(r"\bresistance\b", re.IGNORECASE)
-RE_RETREAT = re.compile(r"\bretreat\b", re.IGNORECASE)
-RE_ABILITY_LINE = re.compile(r"\bAbility\b\s*([A-Za-z0-9'\- ]+)", re.IGNORECASE)
-RE_ATTACK_LINE = re.compile(r"([A-Za-z][A-Za-z0-9'\- ]+?)\s+(\d{10,}|[1-9]\d{0,2}\+?)\b")
+RE_WEAKNESS = _compile_text_pattern(r"\bweakness\b", ignore_case=True)
+RE_RESIST = _compile_text_pattern(r"\bresistance\b", ignore_case=True)
+RE_RETREAT = _compile_text_pattern(r"\bretreat\b", ignore_case=True)
+RE_ABILITY_LINE = _compile_text_pattern(r"\bAbility\b\s*([A-Za-z0-9'\- ]+)", ignore_case=True)
+# A stripped line of 1-30 chars containing a letter (name candidates).
+_RE_SHORT_ALPHA_LINE = re.compile(
+    r"(?m)^[^\S\n]*(?=[^\n]*[A-Za-z])(\S(?:[^\n]{0,28}\S)?)[^\S\n]*$"
+)
+_RE_NONEMPTY_LINE = re.compile(r"(?m)^[^\S\n]*\S")
+RE_ATTACK_LINE = _compile_text_pattern(
+    r"([A-Za-z][A-Za-z0-9'\- ]+?)\s+(\d{10,}|[1-9]\d{0,2}\+?)\b"
+)
+_ABILITY_STOP_PATTERNS = (RE_ATTACK_LINE, RE_WEAKNESS, RE_RESIST, RE_RETREAT, RE_CARDNUM)
 
 PUNCT_REPLACEMENTS = {
     "’": "'",
@@ -445,6 +614,11 @@ class CardRow:
     parse_warnings: str = ""
 
 
+# CSV column order; rows are written as plain tuples pulled with one attrgetter.
+CARD_ROW_FIELDS: Tuple[str, ...] = tuple(f.name for f in dataclass_fields(CardRow))
+_CARD_ROW_VALUES = attrgetter(*CARD_ROW_FIELDS)
+
+
 @dataclass
 class ProcessResult:
     rows: List[CardRow]
@@ -454,44 +628,183 @@ class ProcessResult:
 
 
 def _pil_enhance(img: Image.Image) -> Image.Image:
+    if _HAS_CV2:
+        try:
+            return Image.fromarray(_cv2_enhance(img))
+        except Exception:
+            logger.debug("OpenCV enhance failed; falling back to PIL", exc_info=True)
     gray = ImageOps.grayscale(img)
     gray = ImageOps.autocontrast(gray)
     gray = gray.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
     return gray
 
 
+def _cv2_enhance(img: Image.Image):
+    """OpenCV equivalent of the PIL grayscale -> autocontrast -> unsharp chain."""
+
+    import numpy as np
+
+    if img.mode not in ("L", "RGB"):
+        img = img.convert("RGB")
+    arr = np.asarray(img)
+    gray = cv2.cvtColor(arr, cv2.COLOR_RGB2GRAY) if arr.ndim == 3 else arr.copy()
+    return _enhance_array(gray)
+
+
+def _enhance_array(gray):
+    """Contrast-stretch and unsharp-mask a grayscale ndarray (modified in place)."""
+
+    import numpy as np
+
+    lo, hi = int(gray.min()), int(gray.max())
+    if hi > lo:
+        cv2.normalize(gray, gray, 0, 255, cv2.NORM_MINMAX)
+    # UnsharpMask(radius=2, percent=150, threshold=3): only pixels that differ
+    # from the blur by more than the threshold get sharpened.
+    blur = cv2.GaussianBlur(gray, (0, 0), 2.0)
+    sharp = cv2.addWeighted(gray, 2.5, blur, -1.5, 0)
+    return np.where(cv2.absdiff(gray, blur) > 3, sharp, gray)
+
+
+def _load_and_prepare(image_path: Path) -> Image.Image:
+    """Decode, deskew, auto-crop and enhance a page into the grayscale OCR image.
+
+    With OpenCV the file is decoded once, straight to grayscale, and every step
+    works on that ndarray; only the finished page is wrapped as a PIL image.
+    Without OpenCV (or for formats it can't read) the PIL chain is used.
+    """
+
+    if _HAS_CV2:
+        gray = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if gray is not None:
+            try:
+                return Image.fromarray(_enhance_array(_straighten_array(gray)))
+            except Exception:
+                logger.debug("OpenCV preparation failed for %s; using PIL", image_path, exc_info=True)
+
+    return _pil_enhance(_load_page_pil(image_path))
+
+
+def _load_page_rgb(image_path: Path) -> Image.Image:
+    """Decode, deskew and auto-crop a page in colour, without OCR enhancement.
+
+    For the remote vision model, which reads colour and does its own contrast
+    handling; the grayscale/unsharp pass is left to the Tesseract paths.
+    """
+
+    if _HAS_CV2:
+        bgr = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
+        if bgr is not None:
+            try:
+                return Image.fromarray(_straighten_array(cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)))
+            except Exception:
+                logger.debug("OpenCV preparation failed for %s; using PIL", image_path, exc_info=True)
+
+    return _load_page_pil(image_path)
+
+
+def _straighten_array(arr):
+    """Downscale to the OCR size, deskew and (optionally) auto-crop an ndarray page."""
+
+    scale = _ocr_scale(arr.shape[1], arr.shape[0])
+    if scale < 1.0:
+        arr = cv2.resize(arr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    if USE_DESKEW:
+        arr = _deskew_array(arr)
+    if AUTO_CROP_ENABLED:
+        cropped = _auto_crop_array(arr)
+        if cropped is not None:
+            arr = cropped
+    return arr
+
+
+def _load_page_pil(image_path: Path) -> Image.Image:
+    pil = Image.open(image_path).convert("RGB")
+    scale = _ocr_scale(*pil.size)
+    if scale < 1.0:
+        pil = pil.resize(
+            (int(pil.width * scale), int(pil.height * scale)), Image.LANCZOS
+        )
+    pil = _cv2_deskew_if_available(pil)
+    return _auto_crop_card_if_available(pil)
+
+
+def _ocr_scale(width: int, height: int) -> float:
+    """Factor that brings the longest edge down to ``OCR_MAX_DIM`` (never upscales)."""
+
+    longest = max(width, height)
+    if not OCR_MAX_DIM or longest <= OCR_MAX_DIM:
+        return 1.0
+    return OCR_MAX_DIM / longest
+
+
+def _deskew_array(img):
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if img.ndim == 3 else img
+    gray = cv2.bitwise_not(gray)
+    thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
+    if min(thresh.shape[:2]) * DESKEW_SAMPLE_SCALE >= 100:
+        thresh = cv2.resize(
+            thresh,
+            None,
+            fx=DESKEW_SAMPLE_SCALE,
+            fy=DESKEW_SAMPLE_SCALE,
+            interpolation=cv2.INTER_NEAREST,
+        )
+    coords = cv2.findNonZero(thresh)
+    if coords is None:
+        return img
+    rect = cv2.minAreaRect(coords)
+    angle = rect[-1]
+    if angle < -45:
+        angle = -(90 + angle)
+    else:
+        angle = -angle
+    (h, w) = img.shape[:2]
+    M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
+    return cv2.warpAffine(
+        img, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE
+    )
+
+
 def _cv2_deskew_if_available(pil_img: Image.Image) -> Image.Image:
     if not (USE_DESKEW and _HAS_CV2):
         return pil_img
     try:
         import numpy as np
 
-        img = np.array(pil_img)
-        if img.ndim == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = img
-        gray = cv2.bitwise_not(gray)
-        thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
-        coords = cv2.findNonZero(thresh)
-        if coords is None:
-            return pil_img
-        rect = cv2.minAreaRect(coords)
-        angle = rect[-1]
-        if angle < -45:
-            angle = -(90 + angle)
-        else:
-            angle = -angle
-        (h, w) = img.shape[:2]
-        M = cv2.getRotationMatrix2D((w // 2, h // 2), angle, 1.0)
-        rotated = cv2.warpAffine(
-            img, M, (w, h), flags=cv2.INTER_CUBIC, borderMode=cv2.BORDER_REPLICATE
-        )
-        return Image.fromarray(rotated)
+        return Image.fromarray(_deskew_array(np.array(pil_img)))
     except Exception:
         return pil_img
 
 
+def _auto_crop_array(image):
+    """Return the perspective-corrected card found in ``image``, or ``None``."""
+
+    import numpy as np
+
+    gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY) if image.ndim == 3 else image
+    blur = cv2.GaussianBlur(gray, (5, 5), 0)
+    edged = cv2.Canny(blur, 40, 160)
+    edged = cv2.dilate(edged, np.ones((3, 3), dtype=np.uint8), iterations=1)
+    edged = cv2.erode(edged, np.ones((3, 3), dtype=np.uint8), iterations=1)
+
+    contours, _ = cv2.findContours(
+        edged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+    )
+    if not contours:
+        return None
+    contours = sorted(contours, key=cv2.contourArea, reverse=True)
+    for contour in contours:
+        peri = cv2.arcLength(contour, True)
+        approx = cv2.approxPolyDP(contour, 0.02 * peri, True)
+        if len(approx) != 4:
+            continue
+        warped = _warp_card(image, approx.reshape(4, 2).astype("float32"))
+        if warped is not None:
+            return warped
+    return None
+
+
 def _auto_crop_card_if_available(pil_img: Image.Image) -> Image.Image:
     if not AUTO_CROP_ENABLED:
         return pil_img
@@ -506,27 +819,8 @@ def _auto_crop_card_if_available(pil_img: Image.Image) -> Image.Image:
         image = np.array(pil_img)
         if image.ndim != 3:
             return pil_img
-        bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        edged = cv2.Canny(blur, 40, 160)
-        edged = cv2.dilate(edged, np.ones((3, 3), dtype=np.uint8), iterations=1)
-        edged = cv2.erode(edged, np.ones((3, 3), dtype=np.uint8), iterations=1)
-
-        contours, _ = cv2.findContours(
-            edged, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
-        )
-        if not contours:
-            return pil_img
-        contours = sorted(contours, key=cv2.contourArea, reverse=True)
-        for contour in contours:
-            peri = cv2.arcLength(contour, True)
-            approx = cv2.approxPolyDP(contour, 0.02 * peri, True)
-            if len(approx) != 4:
-                continue
-            warped = _warp_card(image, approx.reshape(4, 2).astype("float32"))
-            if warped is None:
-                continue
+        warped = _auto_crop_array(image)
+        if warped is not None:
             return Image.fromarray(warped)
     except Exception:
         logger.debug("Automatic card crop failed", exc_info=True)
@@ -575,16 +869,31 @@ def _order_points(points):
     return rect
 
 
-def _sha1_of_image(pil_img: Image.Image) -> str:
-    h = hashlib.sha1()
-    h.update(pil_img.tobytes())
-    return h.hexdigest()
+def _page_hash(path: Path) -> str:
+    """Fingerprint of the page's source file for duplicate detection and caching.
+
+    BLAKE3 (memory-mapped, multi-threaded on large pages) when installed,
+    otherwise a streamed SHA-1. The value still lands in the ``page_sha1``
+    column; it is not used for anything security-sensitive.
+    """
+
+    if _HAS_BLAKE3:
+        try:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(path).hexdigest()
+        except (AttributeError, TypeError, ValueError):
+            pass  # older blake3 wheels without update_mmap/AUTO
+    with path.open("rb") as fp:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(fp, "sha1").hexdigest()
+        h = hashlib.sha1()
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            h.update(chunk)
+        return h.hexdigest()
 
 
 def _ocr(pil_img: Image.Image, lang: str = "eng") -> str:
-    config = "--psm 6"
     try:
-        text = pytesseract.image_to_string(pil_img, lang=lang, config=config)
+        text = ocr_text(pil_img, psm=6, lang=lang)
         if len(text) > MAX_OCR_CHARS:
             text = text[:MAX_OCR_CHARS]
         return text
@@ -592,32 +901,93 @@ def _ocr(pil_img: Image.Image, lang: str = "eng") -> str:
         return ""
 
 
-def _first_line_before(text: str, marker_regex: Pattern[str]) -> str:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+def _batch_ocr(
+    crops: Dict[str, Image.Image], lang: str = "eng", config: str = "--psm 6"
+) -> Dict[str, str]:
+    """OCR several crops with a single tesseract process.
+
+    The crops are written to a scratch directory and tesseract is handed a text
+    file listing them; its output has one form-feed separated page per image.
+    Falls back to one ``_ocr`` call per crop if the page count doesn't line up,
+    and goes straight to that when tesserocr makes per-crop calls cheap.
+    """
+
+    if not crops:
+        return {}
+    labels = list(crops)
+    if len(labels) == 1 or uses_tesserocr():
+        return {label: _ocr(crops[label], lang=lang) for label in labels}
+
     try:
-        for i, ln in enumerate(lines):
-            if marker_regex.search(ln):
-                for j in range(i - 1, -1, -1):
-                    cand = lines[j]
-                    if 1 <= len(cand) <= 30 and re.search(r"[A-Za-z]", cand):
-                        return cand
-                break
+        with tempfile.TemporaryDirectory(prefix="pokedata_ocr_") as tmpdir:
+            tmp_path = Path(tmpdir)
+            names = []
+            for i, label in enumerate(labels):
+                img_path = tmp_path / f"{i:03d}.png"
+                crops[label].save(img_path, "PNG")
+                names.append(str(img_path))
+            list_path = tmp_path / "images.txt"
+            list_path.write_text("\n".join(names) + "\n", encoding="utf-8")
+            output = pytesseract.image_to_string(str(list_path), lang=lang, config=config)
     except Exception:
-        pass
-    for ln in lines[:4]:
-        if 1 <= len(ln) <= 30 and re.search(r"[A-Za-z]", ln):
-            return ln
+        logger.debug("Batched tesseract call failed; falling back to per-crop OCR", exc_info=True)
+        output = None
+
+    if output is not None:
+        pages = output.split("\f")
+        if len(pages) == len(labels) + 1 and not pages[-1].strip():
+            pages.pop()
+        if len(pages) == len(labels):
+            return {label: page[:MAX_OCR_CHARS] for label, page in zip(labels, pages)}
+        logger.debug("Batched tesseract returned %d pages for %d crops", len(pages), len(labels))
+    return {label: _ocr(crops[label], lang=lang) for label in labels}
+
+
+def _first_line_before(text: str, marker_regex: Pattern[str]) -> str:
+    """Short alphabetic line right before the first ``marker_regex`` line.
+
+    Falls back to the first such line among the opening four non-empty lines.
+    """
+
+    candidates = list(_RE_SHORT_ALPHA_LINE.finditer(text))
+    if not candidates:
+        return ""
+    starts = [m.start() for m in candidates]
+
+    for marker in marker_regex.finditer(text):
+        if "\n" in marker.group(0):
+            continue  # the old per-line scan never matched across lines
+        line_start = text.rfind("\n", 0, marker.start()) + 1
+        idx = bisect_left(starts, line_start)
+        if idx:
+            return candidates[idx - 1].group(1)
+        break
+
+    opening = list(islice(_RE_NONEMPTY_LINE.finditer(text), 5))
+    limit = opening[4].start() if len(opening) == 5 else len(text) + 1
+    if starts[0] < limit:
+        return candidates[0].group(1)
     return ""
 
 
+@functools.lru_cache(maxsize=None)
+def _combined_stop_pattern(stop_patterns: Tuple[Pattern[str], ...]) -> Pattern[str]:
+    """One alternation of ``stop_patterns``; its first match is the earliest stop.
+
+    The patterns carry case-insensitivity inline (see ``_compile_text_pattern``),
+    so joining their sources preserves each one's flags.
+    """
+
+    return _compile_text_pattern("|".join(f"(?:{pat.pattern})" for pat in stop_patterns))
+
+
 def _extract_block(
-    text: str, start_idx: int, stop_patterns: List[Pattern[str]], max_chars: int = 400
+    text: str, start_idx: int, stop_patterns: Sequence[Pattern[str]], max_chars: int = 400
 ) -> str:
     chunk = text[start_idx : start_idx + max_chars]
-    stops = [m.start() for pat in stop_patterns for m in pat.finditer(chunk)]
-    if stops:
-        end = min(stops)
-        return chunk[:end].strip()
+    m = _combined_stop_pattern(tuple(stop_patterns)).search(chunk)
+    if m:
+        return chunk[: m.start()].strip()
     return chunk.strip()
 
 
@@ -667,8 +1037,7 @@ def parse_text_to_fields(raw_text: str) -> Tuple[Dict[str, str], List[str]]:
     if m:
         out["ability_name"] = m.group(1).strip()
         start = m.end()
-        stop_pats = [RE_ATTACK_LINE, RE_WEAKNESS, RE_RESIST, RE_RETREAT, RE_CARDNUM]
-        out["ability_text"] = _extract_block(text, start, stop_pats, max_chars=400)
+        out["ability_text"] = _extract_block(text, start, _ABILITY_STOP_PATTERNS, max_chars=400)
     else:
         out["ability_name"] = ""
         out["ability_text"] = ""
@@ -708,31 +1077,35 @@ def _postprocess_layout_field(label: str, text: str) -> str:
     return cleaned
 
 
-def _extract_with_layout(pil: Image.Image) -> Dict[str, str]:
-    if not LAYOUT_MODEL:
+def _extract_with_layout(
+    pil: Image.Image, labels: Optional[Collection[str]] = None
+) -> Dict[str, str]:
+    """OCR the layout-model boxes, restricted to ``labels`` when given."""
+
+    if not _LAYOUT_BOXES:
         return {}
     width, height = pil.size
+    crops: Dict[str, Image.Image] = {}
+    for label, x0, y0, x1, y1 in _LAYOUT_BOXES:
+        if labels is not None and label not in labels:
+            continue
+        left, top, right, bottom = x0 * width, y0 * height, x1 * width, y1 * height
+        if right <= left or bottom <= top:
+            continue
+        try:
+            crops[label] = _pil_enhance(pil.crop((left, top, right, bottom)))
+        except Exception:
+            logger.exception("Layout extraction failed for label %s", label)
+
     results: Dict[str, str] = {}
-    for label, box in LAYOUT_MODEL.items():
+    for label, text in _batch_ocr(crops, lang="eng").items():
         try:
-            x = float(box.get("x", 0.0))
-            y = float(box.get("y", 0.0))
-            w = float(box.get("w", 0.0))
-            h = float(box.get("h", 0.0))
-            left = max(0.0, min(1.0, x)) * width
-            top = max(0.0, min(1.0, y)) * height
-            right = max(0.0, min(1.0, x + w)) * width
-            bottom = max(0.0, min(1.0, y + h)) * height
-            if right <= left or bottom <= top:
-                continue
-            crop = pil.crop((left, top, right, bottom))
-            crop = _pil_enhance(crop)
-            text = _ocr(crop, lang="eng")
             value = _postprocess_layout_field(label, text)
-            if value:
-                results[label] = value
         except Exception:
             logger.exception("Layout extraction failed for label %s", label)
+            continue
+        if value:
+            results[label] = value
     return results
 
 
@@ -781,33 +1154,109 @@ def _ensure_poppler_available() -> None:
     )
 
 
-def pdf_to_images(pdf_path: Path, out_dir: Path, dpi: int = 300) -> List[Path]:
-    if not _HAS_PDF2IMAGE:
+def _select_pdf_pages(page_count: int, front_only: bool, limit: int) -> List[int]:
+    """1-based page numbers to rasterize, mirroring the front-only/limit filters."""
+
+    pages = list(range(1, page_count + 1))
+    if front_only:
+        fronts = pages[1::2]  # even pages; scans alternate back/front
+        if fronts:
+            pages = fronts
+    if limit and limit > 0:
+        pages = pages[:limit]
+    return pages
+
+
+def _pdf_page_runs(pages: Sequence[int], chunk: int) -> List[Tuple[int, int]]:
+    """Group ``pages`` into contiguous ``(first, last)`` runs of at most ``chunk`` pages."""
+
+    runs: List[Tuple[int, int]] = []
+    for page in pages:
+        if runs and page == runs[-1][1] + 1 and page - runs[-1][0] < chunk:
+            runs[-1] = (runs[-1][0], page)
+        else:
+            runs.append((page, page))
+    return runs
+
+
+def _render_pdf_run(pdf_path: Path, out_dir: Path, first: int, last: int, dpi: int) -> List[Path]:
+    """Render pages ``first``..``last`` with one pdftoppm process; return the JPEGs in order."""
+
+    prefix = f"{pdf_path.stem}_raw_{first:03d}"
+    # pdftoppm is called directly: pdf2image would re-run pdfinfo for every run.
+    args = [
+        "pdftoppm",
+        "-r", str(dpi),
+        "-f", str(first),
+        "-l", str(last),
+        "-jpeg",
+        "-jpegopt", f"quality={PDF_JPEG_QUALITY},progressive=n,optimize=n",
+        str(pdf_path),
+        str(out_dir / prefix),
+    ]
+    try:
+        proc = subprocess.run(args, capture_output=True)
+    except FileNotFoundError as exc:
         raise RuntimeError(
-            "pdf2image not installed. `pip install pdf2image` and ensure Poppler is on PATH."
-        )
+            "Poppler (pdftoppm/pdfinfo) is required for PDF processing. Install it and retry."
+        ) from exc
+    # pdftoppm names pages <prefix>-<n> zero-padded to a common width, so they sort.
+    rendered = sorted(
+        path for path in out_dir.iterdir() if path.name.startswith(f"{prefix}-")
+    )
+    if proc.returncode != 0 or len(rendered) != last - first + 1:
+        message = proc.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"Failed to read PDF pages {first}-{last}: {message}")
+    results: List[Path] = []
+    for page, raw_path in enumerate(rendered, first):
+        dest = out_dir / f"{pdf_path.stem}_page_{page:03d}.jpg"
+        raw_path.replace(dest)
+        results.append(dest)
+    return results
+
+
+def iter_pdf_pages(
+    pdf_path: Path, out_dir: Path, pages: Sequence[int], dpi: int = 300
+) -> Iterator[Path]:
+    """Rasterize only ``pages`` of ``pdf_path``, yielding each JPEG in page order.
+
+    Contiguous pages are rendered in runs of ``PDF_RENDER_CHUNK``, up to
+    ``PDF_RENDER_WORKERS`` runs at once, so OCR workers start on the first
+    pages while later ones are still being rendered. Pages the filters would
+    throw away are never rendered.
+    """
+
     out_dir.mkdir(parents=True, exist_ok=True)
+    runs = iter(_pdf_page_runs(pages, PDF_RENDER_CHUNK))
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=PDF_RENDER_WORKERS) as executor:
+        try:
+            # Keep a bounded number of runs ahead of the consumer.
+            for first, last in islice(runs, PDF_RENDER_WORKERS * 2):
+                pending.append(executor.submit(_render_pdf_run, pdf_path, out_dir, first, last, dpi))
+            while pending:
+                rendered = pending.popleft().result()
+                for first, last in islice(runs, 1):
+                    pending.append(
+                        executor.submit(_render_pdf_run, pdf_path, out_dir, first, last, dpi)
+                    )
+                yield from rendered
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _pdf_page_count(pdf_path: Path) -> int:
     from pdf2image.exceptions import PDFInfoNotInstalledError, PDFPageCountError
 
-    _ensure_poppler_available()
-
     try:
-        pages = convert_from_path(str(pdf_path), dpi=dpi)
+        return int(pdfinfo_from_path(str(pdf_path))["Pages"])
     except PDFInfoNotInstalledError as exc:
         raise RuntimeError(
             "Poppler (pdftoppm/pdfinfo) is required for PDF processing. Install it and retry."
         ) from exc
-    except PDFPageCountError as exc:
+    except (PDFPageCountError, KeyError, ValueError) as exc:
         raise RuntimeError(f"Failed to read PDF pages: {exc}") from exc
-    except Exception as exc:  # pragma: no cover - unexpected pdf2image issue
-        raise RuntimeError(f"Unexpected PDF conversion error: {exc}") from exc
-    results: List[Path] = []
-    for i, page in enumerate(pages, 1):
-        p = out_dir / f"{pdf_path.stem}_page_{i:03d}.png"
-        page.save(p, "PNG")
-        results.append(p)
-    logger.info("Converted %s into %d image(s) at %sdpi", pdf_path, len(results), dpi)
-    return results
 
 
 def collect_image_inputs(input_path: Path, dpi: int = 300) -> List[Path]:
@@ -818,40 +1267,122 @@ def collect_image_inputs(input_path: Path, dpi: int = 300) -> List[Path]:
         if input_path.suffix.lower() in img_exts:
             return [input_path]
         if input_path.suffix.lower() == ".pdf":
-            return pdf_to_images(input_path, input_path.with_suffix(""), dpi=dpi)
+            if not _HAS_PDF2IMAGE:
+                raise RuntimeError(
+                    "pdf2image not installed. `pip install pdf2image` and ensure Poppler is on PATH."
+                )
+            _ensure_poppler_available()
+            pages = range(1, _pdf_page_count(input_path) + 1)
+            return list(iter_pdf_pages(input_path, input_path.with_suffix(""), pages, dpi=dpi))
         raise ValueError(f"Unsupported input type: {input_path.suffix}")
     raise FileNotFoundError(str(input_path))
 
 
+@functools.lru_cache(maxsize=1)
+def _tesseract_available() -> bool:
+    """Probe for the tesseract binary once per process instead of once per page."""
+
+    try:
+        pytesseract.get_tesseract_version()
+    except pytesseract.pytesseract.TesseractNotFoundError:
+        return False
+    except Exception:
+        return True
+    return True
+
+
 def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[str, str]]]:
-    pil = Image.open(image_path).convert("RGB")
-    pil = _cv2_deskew_if_available(pil)
-    pil = _auto_crop_card_if_available(pil)
-    pil = _pil_enhance(pil)
+    page_sha1 = _page_hash(image_path)
+    cached = _load_cached_page(page_sha1, image_path, index)
+    if cached is not None:
+        logger.debug("Page cache hit for %s (index=%s)", image_path, index)
+        return cached
+    row, structured_payload = _process_page_uncached(image_path, index, page_sha1)
+    _store_cached_page(page_sha1, row, structured_payload)
+    return row, structured_payload
+
+
+def _page_cache_path(page_sha1: str) -> Path:
+    return PAGE_CACHE_DIR / f"{page_sha1}-{_PAGE_CACHE_SALT}.json"
+
+
+def _load_cached_page(
+    page_sha1: str, image_path: Path, index: int
+) -> Optional[Tuple[CardRow, Optional[Dict[str, Any]]]]:
+    if not PAGE_CACHE_ENABLED:
+        return None
+    try:
+        entry = json_utils.loads(_page_cache_path(page_sha1).read_bytes())
+        row = CardRow(**entry["row"])
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug("Ignoring unreadable page cache entry %s", page_sha1, exc_info=True)
+        return None
+    row.source_image = str(image_path)
+    row.page_index = index
+    data = entry.get("structured")
+    structured = {"page_index": index, "image": str(image_path), "data": data} if data else None
+    return row, structured
+
+
+def row_is_degraded(row: CardRow) -> bool:
+    """True when ``row`` came out of a transient failure and should not be cached."""
+
+    return any(w.startswith(_TRANSIENT_WARNINGS) for w in row.parse_warnings.split(","))
+
+
+def _store_cached_page(
+    page_sha1: str, row: CardRow, structured_payload: Optional[Dict[str, Any]]
+) -> None:
+    if not PAGE_CACHE_ENABLED:
+        return
+    if row_is_degraded(row):
+        return
+    entry = {
+        "row": dict(zip(CARD_ROW_FIELDS, _CARD_ROW_VALUES(row))),
+        "structured": structured_payload.get("data") if structured_payload else None,
+    }
+    path = _page_cache_path(page_sha1)
+    try:
+        cache_utils.atomic_write_json(path, entry)
+    except OSError:
+        logger.debug("Could not write page cache entry %s", path, exc_info=True)
+
+
+def _process_page_uncached(
+    image_path: Path, index: int, page_sha1: str
+) -> Tuple[CardRow, Optional[Dict[str, str]]]:
+    if REMOTE_OCR_ENABLED:
+        # The vision model and the layout colour probe get the colour page;
+        # the enhanced grayscale copy is only built once Tesseract runs.
+        pil = _load_page_rgb(image_path)
+        enhanced: Optional[Image.Image] = None
+    else:
+        pil = enhanced = _load_and_prepare(image_path)
+
+    def ocr_image() -> Image.Image:
+        nonlocal enhanced
+        if enhanced is None:
+            enhanced = _pil_enhance(pil)
+        return enhanced
 
     layout_id = "pokemon"
     crops: Optional[CroppedRegions] = None
     hp_probe = ""
 
-    page_sha1 = _sha1_of_image(pil)
     fields: Dict[str, str] = {}
     structured_payload: Optional[Dict[str, str]] = None
     warnings: List[str] = []
     ocr_len = 0
     remote_used = False
-    layout_fields_cached: Optional[Dict[str, str]] = None
     fallback_suggestions: Dict[str, str] = {}
     remote_unreadable_flags: Set[str] = set()
     remote_low_conf_flags: Set[str] = set()
 
-    try:
-        pytesseract.get_tesseract_version()
-        tesseract_available = True
-    except pytesseract.pytesseract.TesseractNotFoundError:
-        tesseract_available = False
+    tesseract_available = _tesseract_available()
+    if not tesseract_available:
         warnings.append("tesseract_missing")
-    except Exception:
-        tesseract_available = True
 
     def ensure_crops() -> Optional[CroppedRegions]:
         nonlocal crops, layout_id, hp_probe
@@ -866,8 +1397,10 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
                 warnings.append(f"layout_error:{exc}")
                 detected = layout_id
 
+        # detect_layout probes colour on ``pil``; region reads use the
+        # enhanced image, as before remote mode kept the page in colour.
         try:
-            current_crops = crop_regions(pil, detected)
+            current_crops = crop_regions(ocr_image(), detected)
         except Exception as exc:
             warnings.append(f"crop_error:{exc}")
             crops = None
@@ -882,7 +1415,7 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
             if not _is_valid_hp(hp_text):
                 layout_id = "trainer"
                 try:
-                    crops = crop_regions(pil, layout_id)
+                    crops = crop_regions(ocr_image(), layout_id)
                 except Exception as exc:
                     warnings.append(f"crop_error:{exc}")
                     crops = None
@@ -949,19 +1482,12 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
 
             fields_to_refill = missing_keys | fields_from_unreadable
             if fields_to_refill or low_conf_suggestion_fields:
-                text = _ocr(pil, lang="eng")
+                text = _ocr(ocr_image(), lang="eng")
                 ocr_len = len(text)
                 fallback_fields, fallback_warnings = parse_text_to_fields(text)
                 for warn in fallback_warnings:
                     warnings.append(f"fallback:{warn}")
 
-                if tesseract_available:
-                    if layout_fields_cached is None:
-                        layout_fields_cached = _extract_with_layout(pil)
-                    layout_fields = layout_fields_cached or {}
-                else:
-                    layout_fields = {}
-
                 for key in sorted(fields_to_refill):
                     candidate = fallback_fields.get(key)
                     if candidate and not fields.get(key):
@@ -969,32 +1495,31 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
                     elif candidate and candidate != fields.get(key):
                         fallback_suggestions.setdefault(key, candidate)
 
-                    candidate_layout = layout_fields.get(key)
-                    if candidate_layout and not fields.get(key):
-                        fields[key] = candidate_layout
-                    elif candidate_layout and candidate_layout != fields.get(key):
-                        fallback_suggestions.setdefault(key, candidate_layout)
-
                 for key in sorted(low_conf_suggestion_fields):
                     candidate = fallback_fields.get(key)
                     if candidate and candidate != fields.get(key):
                         fallback_suggestions.setdefault(key, candidate)
 
-                    candidate_layout = layout_fields.get(key)
-                    if candidate_layout and candidate_layout != fields.get(key):
-                        fallback_suggestions.setdefault(key, candidate_layout)
+                # Only OCR the layout boxes for fields the full-page pass did not fill.
+                still_missing = [key for key in sorted(fields_to_refill) if not fields.get(key)]
+                if tesseract_available and still_missing:
+                    layout_fields = _extract_with_layout(ocr_image(), labels=still_missing)
+                    for key, value in layout_fields.items():
+                        if value and not fields.get(key):
+                            fields[key] = value
         except Exception as exc:
             remote_used = False
             warnings.append(f"remote_error:{exc}")
             logger.warning("Remote OCR failed for %s: %s", image_path.name, exc)
 
     if not remote_used:
-        text = _ocr(pil, lang="eng")
+        text = _ocr(ocr_image(), lang="eng")
         ocr_len = len(text)
-        fields, warnings = parse_text_to_fields(text)
-        if tesseract_available:
-            layout_fields_cached = _extract_with_layout(pil)
-            layout_fields = layout_fields_cached or {}
+        fields, parse_warnings = parse_text_to_fields(text)
+        warnings.extend(parse_warnings)
+        still_missing = [label for label in _LAYOUT_LABELS if not fields.get(label)]
+        if tesseract_available and still_missing:
+            layout_fields = _extract_with_layout(ocr_image(), labels=still_missing)
         else:
             layout_fields = {}
         if layout_fields:
@@ -1019,7 +1544,9 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
 
     # Layout-based fallbacks
     if crops_obj:
-        title_text = extract_title_text(crops_obj)
+        title_text, hp_read, bottom_read = extract_region_texts(
+            crops_obj, include_hp=layout_id != "trainer" and not hp_probe
+        )
         if not fields.get("name") and title_text:
             fields["name"] = title_text
         elif title_text and title_text != fields.get("name"):
@@ -1031,13 +1558,13 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
             fields.setdefault("ability_name", "")
             fields.setdefault("ability_text", "")
         else:
-            hp_text = hp_probe or extract_hp(crops_obj)
+            hp_text = hp_probe or hp_read
             if not fields.get("hp") and hp_text:
                 fields["hp"] = hp_text
             elif hp_text and hp_text != fields.get("hp"):
                 fallback_suggestions.setdefault("hp", hp_text)
 
-        card_number, artist, setbox = extract_bottom_text(crops_obj)
+        card_number, artist, setbox = bottom_read
         if card_number and not fields.get("card_number"):
             fields["card_number"] = card_number
         elif card_number and card_number != fields.get("card_number"):
@@ -1134,37 +1661,107 @@ def process_page(image_path: Path, index: int) -> Tuple[CardRow, Optional[Dict[s
     return row, structured_payload
 
 
-def process_images(images: List[Path]) -> Tuple[List[CardRow], List[Dict[str, str]]]:
+PageResult = Tuple[CardRow, Optional[Dict[str, str]]]
+
+
+def _failed_page(img: Path, idx: int, exc: BaseException) -> PageResult:
+    row = CardRow(
+        source_image=str(img),
+        page_index=idx,
+        parse_warnings=f"exception:{exc}",
+    )
+    return row, None
+
+
+def _process_page_safe(img: Path, idx: int) -> PageResult:
+    # Module-level so it can be pickled into ProcessPoolExecutor workers.
+    try:
+        return process_page(img, idx)
+    except Exception as exc:
+        logger.exception("Failed to process %s (index=%s)", img, idx)
+        return _failed_page(img, idx, exc)
+
+
+def process_images(
+    images: Iterable[Path],
+    progress: Optional[ProgressCallback] = None,
+    *,
+    total: Optional[int] = None,
+) -> Tuple[List[CardRow], List[Dict[str, str]]]:
+    """Process pages concurrently, returning rows in input order.
+
+    Local OCR is tesseract/CPU bound and runs in a process pool; when remote OCR
+    is enabled the work is mostly network waits, so threads are used instead.
+    ``images`` may be a generator (e.g. :func:`iter_pdf_pages`); pages are
+    submitted as it yields them, so pass ``total`` for the progress callback.
+    ``progress`` is called as pages finish, in completion order.
+    """
+
+    if total is None:
+        images = list(images)
+        total = len(images)
+    results: List[Optional[PageResult]] = [None] * total
+    workers = min(PAGE_WORKERS, total)
+
+    if workers <= 1:
+        for idx, img in enumerate(images, 1):
+            results[idx - 1] = _process_page_safe(img, idx)
+            if progress:
+                progress(idx, total)
+    else:
+        if REMOTE_OCR_ENABLED:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            mp_context = multiprocessing.get_context()
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp_context,
+                initializer=install_worker_logging,
+                initargs=(worker_log_queue(mp_context),),
+            )
+        with executor:
+            futures = {
+                executor.submit(_process_page_safe, img, idx): (img, idx)
+                for idx, img in enumerate(images, 1)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                img, idx = futures[future]
+                try:
+                    results[idx - 1] = future.result()
+                except Exception as exc:  # e.g. a crashed worker process
+                    logger.error("Worker failed on %s (index=%s): %s", img, idx, exc)
+                    results[idx - 1] = _failed_page(img, idx, exc)
+                if progress:
+                    progress(done, total)
+
     rows: List[CardRow] = []
     structured_payloads: List[Dict[str, str]] = []
-    for idx, img in enumerate(images, 1):
-        try:
-            row, structured = process_page(img, idx)
-            rows.append(row)
-            if structured:
-                structured_payloads.append(structured)
-        except Exception as exc:
-            empty = CardRow(
-                source_image=str(img),
-                page_index=idx,
-                parse_warnings=f"exception:{exc}",
-            )
-            rows.append(empty)
-            logger.exception("Failed to process %s (index=%s)", img, idx)
+    for result in results:
+        if result is None:  # the page source yielded fewer pages than ``total``
+            continue
+        row, structured = result
+        rows.append(row)
+        if structured:
+            structured_payloads.append(structured)
     return rows, structured_payloads
 
 
-def process_input_path(input_path: Path, limit: int = 0, dpi: int = 300) -> ProcessResult:
+def process_input_path(
+    input_path: Path,
+    limit: int = 0,
+    dpi: int = 300,
+    progress: Optional[ProgressCallback] = None,
+) -> ProcessResult:
+    front_only = os.getenv("POKEDATA_FRONT_ONLY", "1") != "0"
+
     if input_path.suffix.lower() == ".pdf":
         if not _HAS_PDF2IMAGE:
             raise RuntimeError(
                 "pdf2image not installed (and Poppler needed). See README for setup."
             )
-        images = pdf_to_images(input_path, input_path.with_suffix(""), dpi=dpi)
-    else:
-        images = collect_image_inputs(input_path, dpi=dpi)
+        return _process_pdf_streaming(input_path, front_only, limit, dpi, progress)
 
-    front_only = os.getenv("POKEDATA_FRONT_ONLY", "1") != "0"
+    images = collect_image_inputs(input_path, dpi=dpi)
 
     if front_only:
         filtered: List[Path] = []
@@ -1185,31 +1782,87 @@ def process_input_path(input_path: Path, limit: int = 0, dpi: int = 300) -> Proc
         dpi,
         limit,
     )
-    rows, structured = process_images(images)
+    rows, structured = process_images(images, progress=progress)
+    return ProcessResult(rows=rows, images=images, structured=structured)
+
+
+def _process_pdf_streaming(
+    pdf_path: Path,
+    front_only: bool,
+    limit: int,
+    dpi: int,
+    progress: Optional[ProgressCallback],
+) -> ProcessResult:
+    """Rasterize the selected PDF pages one by one while workers OCR earlier ones."""
+
+    _ensure_poppler_available()
+    page_count = _pdf_page_count(pdf_path)
+    pages = _select_pdf_pages(page_count, front_only, limit)
+    if front_only and len(pages) != page_count:
+        logger.info("Front-only mode: filtered %d → %d pages", page_count, len(pages))
+    logger.info(
+        "Processing %d page(s) from %s (dpi=%s, limit=%s)", len(pages), pdf_path, dpi, limit
+    )
+
+    images: List[Path] = []
+
+    def produced() -> Iterator[Path]:
+        for image in iter_pdf_pages(pdf_path, pdf_path.with_suffix(""), pages, dpi=dpi):
+            images.append(image)
+            yield image
+
+    rows, structured = process_images(produced(), progress=progress, total=len(pages))
     return ProcessResult(rows=rows, images=images, structured=structured)
 
 
 def write_csv(rows: List[CardRow], out_csv: Path) -> None:
+    """Write ``rows`` to ``out_csv``; a ``.parquet`` suffix writes Parquet instead."""
+
     out_csv.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = list(asdict(CardRow(source_image="", page_index=0)).keys())
-    with out_csv.open("w", newline="", encoding="utf-8") as fp:
-        writer = csv.DictWriter(fp, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(asdict(row))
+    if out_csv.suffix.lower() == ".parquet":
+        _write_parquet(rows, out_csv)
+        return
+    # A 1 MiB buffer turns thousands of small row writes into a few large ones.
+    with out_csv.open("w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as fp:
+        writer = csv.writer(fp)
+        writer.writerow(CARD_ROW_FIELDS)
+        writer.writerows(map(_CARD_ROW_VALUES, rows))
     logger.info("Wrote CSV %s with %d row(s)", out_csv, len(rows))
 
 
+def _write_parquet(rows: List[CardRow], out_path: Path) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError("Parquet output needs pyarrow. `pip install pyarrow` and retry.") from exc
+
+    columns = zip(*map(_CARD_ROW_VALUES, rows)) if rows else [()] * len(CARD_ROW_FIELDS)
+    table = pa.table(dict(zip(CARD_ROW_FIELDS, map(list, columns))))
+    pq.write_table(table, out_path)
+    logger.info("Wrote Parquet %s with %d row(s)", out_path, len(rows))
+
+
 def process_to_csv(
-    input_path: Path, out_csv: Path, *, limit: int = 0, dpi: int = 300
+    input_path: Path,
+    out_csv: Path,
+    *,
+    limit: int = 0,
+    dpi: int = 300,
+    progress: Optional[ProgressCallback] = None,
 ) -> ProcessResult:
-    result = process_input_path(input_path, limit=limit, dpi=dpi)
+    result = process_input_path(input_path, limit=limit, dpi=dpi, progress=progress)
     write_csv(result.rows, out_csv)
     result.csv_path = out_csv
     return result
 
 
 def ensure_dependencies_ready() -> None:
+    """Check external tools and warm caches; later calls in the process are no-ops."""
+
+    global _READY
+    if _READY:
+        return
     if not _HAS_PDF2IMAGE:
         logger.warning(
             "pdf2image not available. PDF uploads will fail unless the dependency is installed."
@@ -1218,3 +1871,24 @@ def ensure_dependencies_ready() -> None:
         _ensure_poppler_available()
     except RuntimeError as exc:
         logger.warning("%s", exc)
+    if not _tesseract_available():
+        logger.warning("Tesseract not found; local OCR fields will be empty.")
+    if GRADING_PRELOAD:
+        preload_reader()
+    if WARMUP_IMAGE:
+        _warm_up(Path(WARMUP_IMAGE))
+    _READY = True
+
+
+def _warm_up(image_path: Path) -> None:
+    """Run one page through the pipeline so the first real upload starts warm."""
+
+    if not image_path.is_file():
+        logger.warning("Warm-up image %s not found; skipping warm-up", image_path)
+        return
+    try:
+        process_page(image_path, 0)
+    except Exception:  # noqa: BLE001 - warm-up is best effort
+        logger.warning("Warm-up run on %s failed", image_path, exc_info=True)
+    else:
+        logger.info("Pipeline warmed up with %s", image_path)
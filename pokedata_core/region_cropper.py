@@ -3,18 +3,20 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
-import shlex
 import string
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Sequence, Tuple
+from typing import Dict, Optional, Tuple
 
 from PIL import Image, ImageOps
 import pytesseract
-from pytesseract import Output
 from pytesseract.pytesseract import TesseractNotFoundError
 
 from .layouts import POKEMON_LAYOUT, TRAINER_LAYOUT, Layout
+from .ocr_engine import OcrTokens, ocr_text, ocr_tokens
 
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,7 @@ __all__ = [
     "extract_title_text",
     "extract_hp",
     "extract_bottom_text",
+    "extract_region_texts",
 ]
 
 
@@ -33,6 +36,64 @@ TRAINER_KEYWORDS = {"TRAINER", "SUPPORTER", "ITEM", "STADIUM"}
 HEADER_WHITELIST = string.ascii_uppercase
 TITLE_WHITELIST = string.ascii_letters + string.digits + "'-."
 HP_WHITELIST = string.digits
+# Tesseract time grows with pixel count and region text is legible well below
+# this, so larger crops (e.g. full-width strips of big scans) are scaled down.
+MAX_CROP_EDGE = 1200
+COLOR_PROBE_SIZE = (80, 40)
+COLOR_TRAINER_RATIO = 0.35
+COLOR_POKEMON_RATIO = 0.02
+_TRAINER_VAL_MIN = 141  # ceil(0.55 * 255)
+
+_RE_CARDNUM = re.compile(r"(\w{1,3}\s*/\s*\w{1,3}|SWSH\d{3}|TG\d{2}|\d{3}/\d{3})", re.IGNORECASE)
+_RE_ARTIST = re.compile(r"illus\.?\s*([^|]+)$", re.IGNORECASE)
+_RE_SETBOX = re.compile(r"\b[A-Z]{2,4}\b")
+_BOTTOM_PATTERNS = (("number", _RE_CARDNUM), ("artist", _RE_ARTIST), ("setbox", _RE_SETBOX))
+_RE_BOTTOM_SCAN = re.compile(
+    r"(?=(?i:\w{1,3}\s*/\s*\w{1,3}|SWSH\d{3}|TG\d{2}|\d{3}/\d{3})"
+    r"|(?i:illus\.?\s*[^|]+$)"
+    r"|\b[A-Z]{2,4}\b)"
+)
+_RE_LEADING_NON_ALPHA = re.compile(r"^[^A-Za-z]+")
+_RE_BANNER_WORD = re.compile(r"^(TRAINER|SUPPORTER|ITEM|STADIUM)\b[:\-]*\s*", re.IGNORECASE)
+_RE_NON_UPPER = re.compile(r"[^A-Z]")
+_RE_TRAINER_KEYWORD = re.compile("|".join(sorted(TRAINER_KEYWORDS)))
+
+# Title, HP and bottom-strip reads are independent Tesseract calls. Threads
+# suffice: the work happens in the tesseract subprocess or in tesserocr, and
+# page workers may already be processes that should not spawn pools of their own.
+REGION_WORKERS = min(os.cpu_count() or 1, 4)
+# Created lazily and owned by one process: a forked page worker inherits the
+# parent's executor object but none of its threads, so submitting to it would
+# block forever. The pid check covers platforms without register_at_fork.
+_REGION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_REGION_EXECUTOR_PID = 0
+_REGION_EXECUTOR_LOCK = threading.Lock()
+
+
+def _region_executor() -> Optional[ThreadPoolExecutor]:
+    global _REGION_EXECUTOR, _REGION_EXECUTOR_PID
+    if REGION_WORKERS <= 1:
+        return None
+    pid = os.getpid()
+    if _REGION_EXECUTOR is None or _REGION_EXECUTOR_PID != pid:
+        with _REGION_EXECUTOR_LOCK:
+            if _REGION_EXECUTOR is None or _REGION_EXECUTOR_PID != pid:
+                _REGION_EXECUTOR = ThreadPoolExecutor(
+                    max_workers=REGION_WORKERS, thread_name_prefix="region-ocr"
+                )
+                _REGION_EXECUTOR_PID = pid
+    return _REGION_EXECUTOR
+
+
+def _reset_region_executor() -> None:
+    global _REGION_EXECUTOR, _REGION_EXECUTOR_LOCK
+    # The parent's lock may have been held mid-fork; the child needs fresh state.
+    _REGION_EXECUTOR = None
+    _REGION_EXECUTOR_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_region_executor)
 
 
 @dataclass
@@ -50,28 +111,20 @@ def detect_layout(image: Image.Image) -> str:
     header_img = image.crop(header_box)
     header_img = ImageOps.expand(header_img, border=5, fill="white")
 
-    tokens = _extract_tokens(
-        header_img,
-        config=_build_tesseract_config(
-            ["--psm", "6", "-c", f"tessedit_char_whitelist={HEADER_WHITELIST}"]
-        ),
-    )
-    token_text = " ".join(token["text"] for token in tokens)
-
-    try:
-        text = pytesseract.image_to_string(
-            header_img,
-            config=_build_tesseract_config(
-                ["--psm", "7", "-c", f"tessedit_char_whitelist={HEADER_WHITELIST}"]
-            ),
-        )
-    except TesseractNotFoundError:
-        logger.debug("Tesseract not available; skipping header text OCR for layout detection")
-        text = ""
-    combined = " ".join(part for part in (token_text, text) if part).strip()
-
-    token_score = _score_trainer_tokens(tokens)
+    # The banner colour ratio is a pixel fraction, so a thumbnail estimates it
+    # well. On colour scans a clear verdict either way skips Tesseract; the
+    # grayscale OCR page has no hue to go on and always takes the token path.
     color_score = _trainer_color_ratio(header_img)
+    if header_img.mode == "RGB":
+        if color_score > COLOR_TRAINER_RATIO:
+            return "trainer"
+        if color_score < COLOR_POKEMON_RATIO:
+            return "pokemon"
+
+    tokens = _extract_tokens(header_img, psm=6, whitelist=HEADER_WHITELIST)
+    # The banner keywords are matched on the token text; a second psm-7 read of
+    # the same header only repeated the recognition.
+    combined, token_score = _score_trainer_tokens(tokens)
 
     if _looks_like_trainer_banner(combined):
         return "trainer"
@@ -87,22 +140,35 @@ def detect_layout(image: Image.Image) -> str:
 def crop_regions(image: Image.Image, layout_id: str) -> CroppedRegions:
     layout = TRAINER_LAYOUT if layout_id == "trainer" else POKEMON_LAYOUT
     crops: Dict[str, Image.Image] = {}
-    for name, box in layout.regions.items():
-        crops[name] = image.crop(_normalize_to_box(image, box))
+    width, height = image.size
+    for name, box in zip(layout.labels, layout.pixel_boxes(width, height).tolist()):
+        crops[name] = _ocr_ready(image.crop(tuple(box)))
     return CroppedRegions(layout_id=layout_id, layout=layout, regions=crops)
 
 
+def _ocr_ready(crop: Image.Image) -> Image.Image:
+    """Cap ``crop`` at ``MAX_CROP_EDGE`` pixels and make it 8-bit grayscale.
+
+    Tesseract binarises to gray anyway; an ``L`` crop is handed to tesserocr as
+    raw bytes (no re-encode) and makes a third of the temp PNG for the CLI.
+    """
+
+    if crop.mode != "L":
+        crop = crop.convert("L")
+    longest = max(crop.size)
+    if longest <= MAX_CROP_EDGE:
+        return crop
+    scale = MAX_CROP_EDGE / longest
+    size = (max(1, int(crop.width * scale)), max(1, int(crop.height * scale)))
+    return crop.resize(size, Image.BILINEAR)
+
+
 def extract_title_text(crops: CroppedRegions) -> str:
     title_img = crops.regions.get("title")
     if not title_img:
         return ""
     try:
-        text = pytesseract.image_to_string(
-            title_img,
-            config=_build_tesseract_config(
-                ["--psm", "7", "-c", f"tessedit_char_whitelist={TITLE_WHITELIST}"]
-            ),
-        ).strip()
+        text = ocr_text(title_img, psm=7, whitelist=TITLE_WHITELIST).strip()
     except TesseractNotFoundError:
         logger.debug("Tesseract not available; title extraction skipped")
         text = ""
@@ -118,12 +184,7 @@ def extract_hp(crops: CroppedRegions) -> str:
     if not hp_img:
         return ""
     try:
-        text = pytesseract.image_to_string(
-            hp_img,
-            config=_build_tesseract_config(
-                ["--psm", "7", "-c", f"tessedit_char_whitelist={HP_WHITELIST}"]
-            ),
-        ).strip()
+        text = ocr_text(hp_img, psm=7, whitelist=HP_WHITELIST).strip()
     except TesseractNotFoundError:
         logger.debug("Tesseract not available; HP extraction skipped")
         text = ""
@@ -136,16 +197,34 @@ def extract_bottom_text(crops: CroppedRegions) -> Tuple[str, str, str]:
     if not meta_img:
         return "", "", ""
     try:
-        text = pytesseract.image_to_string(meta_img, config="--psm 6").strip()
+        text = ocr_text(meta_img, psm=6).strip()
     except TesseractNotFoundError:
         logger.debug("Tesseract not available; bottom metadata extraction skipped")
         return "", "", ""
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     joined = " ".join(lines)
-    card_number = _find_card_number(joined)
-    artist = _find_artist(joined)
-    setbox = _find_setbox(joined)
-    return card_number, artist, setbox
+    return _parse_bottom_text(joined)
+
+
+def extract_region_texts(
+    crops: CroppedRegions, *, include_hp: bool = True
+) -> Tuple[str, str, Tuple[str, str, str]]:
+    """Run the title, HP and bottom-strip OCR concurrently.
+
+    Returns ``(title, hp, (card_number, artist, setbox))``; ``hp`` is empty when
+    ``include_hp`` is false or the layout is a trainer.
+    """
+
+    executor = _region_executor()
+    if executor is None:
+        hp = extract_hp(crops) if include_hp else ""
+        return extract_title_text(crops), hp, extract_bottom_text(crops)
+
+    title_future = executor.submit(extract_title_text, crops)
+    hp_future = executor.submit(extract_hp, crops) if include_hp else None
+    bottom = extract_bottom_text(crops)  # the caller's thread takes one share
+    hp = hp_future.result() if hp_future is not None else ""
+    return title_future.result(), hp, bottom
 
 
 def _normalize_to_box(image: Image.Image, box: Tuple[float, float, float, float]) -> Tuple[int, int, int, int]:
@@ -162,42 +241,34 @@ def _strip_trainer_banner(text: str) -> str:
         return ""
 
     cleaned = text.strip()
-    cleaned = re.sub(r"^[^A-Za-z]+", "", cleaned)
-    cleaned = re.sub(
-        r"^(TRAINER|SUPPORTER|ITEM|STADIUM)\b[:\-]*\s*",
-        "",
-        cleaned,
-        flags=re.IGNORECASE,
-    )
+    cleaned = _RE_LEADING_NON_ALPHA.sub("", cleaned)
+    cleaned = _RE_BANNER_WORD.sub("", cleaned)
     return cleaned.strip(" :-")
 
 
 def _looks_like_trainer_banner(text: str) -> bool:
     if not text:
         return False
-    letters = re.sub(r"[^A-Z]", "", text.upper())
-    return any(token in letters for token in TRAINER_KEYWORDS)
+    letters = _RE_NON_UPPER.sub("", text.upper())
+    return _RE_TRAINER_KEYWORD.search(letters) is not None
 
 
-def _score_trainer_tokens(tokens: Sequence[Dict[str, object]]) -> float:
-    if not tokens:
-        return 0.0
+def _score_trainer_tokens(tokens: OcrTokens) -> Tuple[str, float]:
+    """Return the joined header text and its trainer-keyword score in one pass."""
+
+    parts = []
     matches = 0.0
-    total = 0.0
-    for token in tokens:
-        text = str(token.get("text", "")).strip()
-        if not text:
-            continue
-        cleaned = re.sub(r"[^A-Z]", "", text.upper())
+    total = 0
+    for text, conf in zip(tokens.text, tokens.confidence):
+        parts.append(text)
+        cleaned = _RE_NON_UPPER.sub("", text.upper())
         if not cleaned:
             continue
-        total += 1.0
-        if any(keyword in cleaned for keyword in TRAINER_KEYWORDS):
-            conf = float(token.get("confidence", 0.0) or 0.0)
+        total += 1
+        if _RE_TRAINER_KEYWORD.search(cleaned):
             matches += 1.0 + max(conf, 0.0) / 100.0
-    if total == 0:
-        return 0.0
-    return matches / total
+    combined = " ".join(parts).strip()
+    return combined, (matches / total if total else 0.0)
 
 
 def _trainer_color_ratio(image: Image.Image) -> float:
@@ -208,106 +279,68 @@ def _trainer_color_ratio(image: Image.Image) -> float:
     except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
         logger.debug("Skipping trainer color ratio; numpy not available")
         return 0.0
-    hsv = image.convert("HSV")
-    hsv_np = np.asarray(hsv)
-    if hsv_np.size == 0:
+    if image.width > COLOR_PROBE_SIZE[0] or image.height > COLOR_PROBE_SIZE[1]:
+        # A pixel fraction survives downsampling; the probe keeps the pass tiny.
+        image = image.resize(COLOR_PROBE_SIZE, Image.BILINEAR)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    rgb = np.asarray(image, dtype=np.int16)
+    if rgb.size == 0:
         return 0.0
-    hue = hsv_np[..., 0].astype(np.float32) * (360.0 / 255.0)
-    sat = hsv_np[..., 1].astype(np.float32) / 255.0
-    val = hsv_np[..., 2].astype(np.float32) / 255.0
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    maxc = rgb.max(axis=-1)
+    delta = maxc - rgb.min(axis=-1)
+    rise = green - blue
+    # Hue 18-48 degrees lies in the red-max sextant, where hue = 60 * (g - b) / delta;
+    # saturation >= 0.35 and value >= 0.55 follow. Integer arithmetic, no HSV image.
     mask = (
-        (hue >= 18.0)
-        & (hue <= 48.0)
-        & (sat >= 0.35)
-        & (val >= 0.55)
+        (red == maxc)
+        & (delta > 0)
+        & (10 * rise >= 3 * delta)
+        & (10 * rise <= 8 * delta)
+        & (20 * delta >= 7 * maxc)
+        & (maxc >= _TRAINER_VAL_MIN)
     )
-    if not mask.any():
-        return 0.0
-    return float(mask.sum()) / float(mask.size)
+    hits = np.count_nonzero(mask)
+    return hits / mask.size if hits else 0.0
 
 
-def _extract_tokens(image: Image.Image, config: str) -> List[Dict[str, object]]:
+def _extract_tokens(
+    image: Image.Image, *, psm: int, whitelist: Optional[str] = None
+) -> OcrTokens:
     try:
-        data = pytesseract.image_to_data(
-            image,
-            output_type=Output.DICT,
-            config=config,
-        )
+        return ocr_tokens(image, psm=psm, whitelist=whitelist)
     except (pytesseract.TesseractError, TesseractNotFoundError):
         logger.debug("Tesseract not available; returning empty token set")
-        return []
+        return OcrTokens([], [], [])
 
-    tokens: List[Dict[str, object]] = []
-    n = len(data.get("text", []))
-    for idx in range(n):
-        text = str(data["text"][idx]).strip()
-        if not text:
-            continue
-        try:
-            conf_val = float(data.get("conf", [0])[idx])
-        except (ValueError, TypeError, IndexError):
-            conf_val = 0.0
-        tokens.append(
-            {
-                "text": text,
-                "confidence": conf_val,
-                "bbox": (
-                    int(data.get("left", [0])[idx]),
-                    int(data.get("top", [0])[idx]),
-                    int(data.get("width", [0])[idx]),
-                    int(data.get("height", [0])[idx]),
-                ),
-            }
-        )
-    return tokens
-
-
-def _find_card_number(text: str) -> str:
-    import re
-
-    match = re.search(r"(\w{1,3}\s*/\s*\w{1,3}|SWSH\d{3}|TG\d{2}|\d{3}/\d{3})", text, re.IGNORECASE)
-    if match:
-        return match.group(0).replace(" ", "")
-    return ""
-
-
-def _find_artist(text: str) -> str:
-    import re
-
-    match = re.search(r"illus\.?\s*([^|]+)$", text, re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    tokens = text.split("©")
-    if tokens and len(tokens[-1].strip()) < 40:
-        return tokens[-1].strip()
-    return ""
-
-
-def _find_setbox(text: str) -> str:
-    import re
-
-    match = re.search(r"\b[A-Z]{2,4}\b", text)
-    if match:
-        return match.group(0)
-    return ""
-
-
-def _build_tesseract_config(args: Sequence[str]) -> str:
-    """Return a shell-safe config string for pytesseract.
-
-    pytesseract's ``config`` parameter is a string that is split with
-    :func:`shlex.split` internally.  Any raw single quotes therefore start a
-    quoted segment which raises ``ValueError('No closing quotation')`` unless
-    they are escaped.  We expand single quotes using the standard POSIX
-    ``'"'"'`` pattern so that the downstream splitter reconstructs the original
-    argument verbatim.
-    """
 
-    escaped: list[str] = []
-    for arg in args:
-        if "'" in arg:
-            escaped.append("'" + arg.replace("'", "'\"'\"'") + "'")
-        else:
-            escaped.append(shlex.quote(arg))
-    return " ".join(escaped)
+def _parse_bottom_text(text: str) -> Tuple[str, str, str]:
+    """Return ``(card_number, artist, setbox)`` from the joined bottom strip.
 
+    One zero-width scan finds every position where any of the three patterns
+    can start; each still-missing field is then tried only at those positions,
+    so each gets the same first hit its own ``search`` would return.
+    """
+
+    found: Dict[str, "re.Match[str]"] = {}
+    for candidate in _RE_BOTTOM_SCAN.finditer(text):
+        pos = candidate.start()
+        for key, pattern in _BOTTOM_PATTERNS:
+            if key not in found:
+                hit = pattern.match(text, pos)
+                if hit:
+                    found[key] = hit
+        if len(found) == len(_BOTTOM_PATTERNS):
+            break
+
+    number = found.get("number")
+    card_number = number.group(0).replace(" ", "") if number else ""
+    artist_match = found.get("artist")
+    if artist_match:
+        artist = artist_match.group(1).strip()
+    else:
+        tail = text.split("©")[-1].strip()
+        artist = tail if len(tail) < 40 else ""
+    setbox = found["setbox"].group(0) if "setbox" in found else ""
+    return card_number, artist, setbox
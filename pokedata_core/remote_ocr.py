@@ -2,136 +2,302 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import functools
+import hashlib
 import io
-import json
 import os
+import queue
 import re
+import time
 import copy
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from jsonschema import Draft202012Validator
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+from PIL import Image
 
+from . import cache_utils, json_utils, schema_registry
 from .logging_utils import get_logger
 
+try:
+    import pybase64  # type: ignore
+
+    _b64encode = pybase64.b64encode  # SIMD-accelerated, same output
+except Exception:  # pragma: no cover - optional dependency
+    _b64encode = base64.b64encode
+
 
 logger = get_logger("remote_ocr")
 
 _CLIENT: Optional[OpenAI] = None
-_CARD_SCHEMA = None
-_VALIDATOR: Optional[Draft202012Validator] = None
-SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "card_schema.json"
+_DEBUG_COUNTER = count()
+SCHEMA_PATH = schema_registry.SCHEMA_DIR / "card_schema.json"
+
+try:
+    REMOTE_CONCURRENCY = max(1, int(os.getenv("POKEDATA_REMOTE_CONCURRENCY", "8")))
+except (TypeError, ValueError):
+    REMOTE_CONCURRENCY = 8
+
+# Opt back in to a low-detail whole-card image alongside the three crops.
+REMOTE_FULL_IMAGE = os.getenv("POKEDATA_REMOTE_FULL_IMAGE", "0") == "1"
+
+# Structured results keyed by image pixels + model + prompt, so re-running the
+# same cards (debugging, retries) skips the API round-trip.
+# POKEDATA_NO_CACHE=1 bypasses it, like the pipeline's page cache.
+RESULT_CACHE_ENABLED = cache_utils.CACHE_ENABLED
+RESULT_CACHE_DIR = cache_utils.cache_dir("remote_ocr")
+
+
+def _require_api_key() -> str:
+    api_key = os.getenv("POKEDATA_OPENAI_API_KEY")
+    if not api_key:
+        raise RuntimeError(
+            "POKEDATA_OPENAI_API_KEY environment variable not set; remote OCR unavailable."
+        )
+    return api_key
 
 
 def _get_client() -> OpenAI:
     global _CLIENT
     if _CLIENT is None:
-        api_key = os.getenv("POKEDATA_OPENAI_API_KEY")
-        if not api_key:
-            raise RuntimeError(
-                "POKEDATA_OPENAI_API_KEY environment variable not set; remote OCR unavailable."
-            )
-        _CLIENT = OpenAI(api_key=api_key)
+        _CLIENT = OpenAI(api_key=_require_api_key())
     return _CLIENT
 
 
-def _get_validator() -> Draft202012Validator:
-    global _CARD_SCHEMA, _VALIDATOR
-    if _VALIDATOR is None:
-        if not SCHEMA_PATH.exists():
-            raise RuntimeError(f"Card schema not found at {SCHEMA_PATH}")
-        _CARD_SCHEMA = json.loads(SCHEMA_PATH.read_text())
-        _VALIDATOR = Draft202012Validator(_CARD_SCHEMA)
-    return _VALIDATOR
+def _schema_errors(data: Any) -> list:
+    """Validation errors for ``data``, sorted by path; empty when it is valid."""
+
+    return schema_registry.schema_errors(SCHEMA_PATH, data)
+
+
+# Compile the validators at import so the first card does not pay for reading
+# and compiling the schema; a missing schema is still reported on first use.
+schema_registry.preload(SCHEMA_PATH)
+
+
+# JPEG is several times smaller than PNG for card scans, which shrinks the
+# request body and upload time; the vision model reads either equally well.
+IMAGE_MIME = "image/jpeg"
+JPEG_QUALITY = 85
+# Vision input is billed per 512px tile; cards are downscaled to this longest
+# edge before cropping, which keeps every crop legible and small.
+MAX_IMAGE_EDGE = 1024
+_DATA_URI_PREFIX = f"data:{IMAGE_MIME};base64,"
+# One worker per image in a request (three crops, four with the full card);
+# more than the host has cores would only contend for them.
+_ENCODE_POOL = ThreadPoolExecutor(
+    max_workers=max(1, min(4, os.cpu_count() or 2)), thread_name_prefix="remote-encode"
+)
+# Encode buffers are recycled so their grown storage is reused across cards.
+_BUFFER_POOL: "queue.LifoQueue[io.BytesIO]" = queue.LifoQueue(maxsize=8)
 
 
 def _encode_image(pil_img) -> str:
-    buffer = io.BytesIO()
-    pil_img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+    """``data:`` URI of ``pil_img`` as JPEG, encoded into a pooled buffer."""
+
+    if pil_img.mode not in ("RGB", "L"):
+        pil_img = pil_img.convert("RGB")
+    buffer = _acquire_buffer()
+    try:
+        pil_img.save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=False)
+        size = buffer.tell()
+        with buffer.getbuffer() as view, view[:size] as encoded:
+            return _DATA_URI_PREFIX + _b64encode(encoded).decode("ascii")
+    finally:
+        _release_buffer(buffer)
 
 
-def _build_prompt(
-    full_b64: str, header_b64: str, middle_b64: str, footer_b64: str
-) -> List[Dict[str, str]]:
-    instructions = (
-        "You are a meticulous Pokémon card transcriber. Always respond with a single JSON object that satisfies the schema hints below. "
+def _acquire_buffer() -> io.BytesIO:
+    try:
+        buffer = _BUFFER_POOL.get_nowait()
+    except queue.Empty:
+        return io.BytesIO()
+    buffer.seek(0)
+    return buffer
+
+
+def _release_buffer(buffer: io.BytesIO) -> None:
+    # No truncate(): shrinking would free the storage the pool exists to keep.
+    # The next encode overwrites from offset 0 and reads back only tell() bytes.
+    try:
+        _BUFFER_POOL.put_nowait(buffer)
+    except queue.Full:
+        pass
+
+
+# The crops always carry the text; the optional whole card is context only.
+_IMAGES_NOTE = (
+    "The card arrives as three crops (header, main text area, footer) plus a low-detail image of the whole card for layout context; read every field from the crops. "
+    if REMOTE_FULL_IMAGE
+    else "The card arrives as three crops (header, main text area, footer) that together cover the whole card; read every field from them. "
+)
+
+_INSTRUCTIONS = (
+    "You are a meticulous Pokémon card transcriber. Always respond with a single JSON object that satisfies the schema hints below. "
+    + _IMAGES_NOTE
+    + (
         "Never invent information. If any field is unreadable, set it to null and list the JSON pointer (e.g. 'name', 'text.attacks[0].damage') in notes.unreadable. "
         "Stages must be one of: Basic, Stage 1, Stage 2, Restored, Mega Evolution, BREAK, LEGEND. "
         "Energy or type references must be converted to these canonical tokens: Colorless, Darkness, Dragon, Fairy, Fighting, Fire, Grass, Lightning, Metal, Psychic, Water."
     )
+)
+
+_SCHEMA_HINT = (
+    "Required top-level fields: name, stage, evolvesFrom, hp, types, stamps, promo, number, set, setboxLetters, printYear, illustrator, text, notes, _confidence. "
+    "Within text, capture abilities (name, text, kind when printed), attacks (name, cost array, damage text or number, rules text), weaknesses/resistances (type + value such as ×2, -30), and retreatCost. "
+    "Populate promo.isPromo=true only if the card is explicitly a promo; otherwise false and leave series/promoNumber null. "
+    "Card number must include suffixes like TG01 or 014/189 exactly as printed. Set.name is the printed set title, and set.code is the 2-4 letter abbreviation if visible; leave null if not printed."
+)
+
+_FORMAT_HINT = (
+    "Return JSON only. Example skeleton: {\n"
+    "  \"name\": \"Charizard\",\n"
+    "  \"stage\": \"Stage 2\",\n"
+    "  \"evolvesFrom\": \"Charmeleon\",\n"
+    "  \"hp\": 170,\n"
+    "  \"types\": [\"Fire\"],\n"
+    "  \"stamps\": [],\n"
+    "  \"promo\": {\"isPromo\": false, \"series\": null, \"promoNumber\": null},\n"
+    "  \"number\": \"014/189\",\n"
+    "  \"set\": {\"name\": \"Darkness Ablaze\", \"code\": \"DAA\", \"total\": 189, \"symbolCode\": null},\n"
+    "  \"setboxLetters\": \"MEG\",\n"
+    "  \"printYear\": 2020,\n"
+    "  \"illustrator\": \"5ban Graphics\",\n"
+    "  \"text\": {\n"
+    "    \"abilities\": [{\"name\": \"Roaring Resolve\", \"text\": \"...\", \"kind\": \"Ability\"}],\n"
+    "    \"attacks\": [{\"name\": \"Flare Blitz\", \"cost\": [\"Fire\",\"Fire\"], \"damage\": \"120+\", \"text\": \"...\"}],\n"
+    "    \"weaknesses\": [{\"type\": \"Water\", \"value\": \"×2\"}],\n"
+    "    \"resistances\": [],\n"
+    "    \"retreatCost\": [\"Colorless\", \"Colorless\"]\n"
+    "  },\n"
+    "  \"notes\": {\"unreadable\": []},\n"
+    "  \"_confidence\": {\"name\": 0.95}\n"
+    "}"
+)
+
+# Prompt parts shared by every request; only the image URIs vary per card.
+_PROMPT_PREFIX: Tuple[Dict[str, str], ...] = (
+    {"type": "input_text", "text": _INSTRUCTIONS},
+    {"type": "input_text", "text": _SCHEMA_HINT},
+    {"type": "input_text", "text": _FORMAT_HINT},
+)
+_FULL_LABEL = {"type": "input_text", "text": "Whole card at low detail (layout context only):"}
+_HEADER_LABEL = {"type": "input_text", "text": "Header crop (name, stage/evolves from, HP, type banner):"}
+_MIDDLE_LABEL = {"type": "input_text", "text": "Main text area (abilities, attacks, rules):"}
+_FOOTER_LABEL = {
+    "type": "input_text",
+    "text": "Footer crop (setbox letters, card number, rarity, illustrator, year):",
+}
 
-    schema_hint = (
-        "Required top-level fields: name, stage, evolvesFrom, hp, types, stamps, promo, number, set, setboxLetters, printYear, illustrator, text, notes, _confidence. "
-        "Within text, capture abilities (name, text, kind when printed), attacks (name, cost array, damage text or number, rules text), weaknesses/resistances (type + value such as ×2, -30), and retreatCost. "
-        "Populate promo.isPromo=true only if the card is explicitly a promo; otherwise false and leave series/promoNumber null. "
-        "Card number must include suffixes like TG01 or 014/189 exactly as printed. Set.name is the printed set title, and set.code is the 2-4 letter abbreviation if visible; leave null if not printed."
-    )
 
-    format_hint = (
-        "Return JSON only. Example skeleton: {\n"
-        "  \"name\": \"Charizard\",\n"
-        "  \"stage\": \"Stage 2\",\n"
-        "  \"evolvesFrom\": \"Charmeleon\",\n"
-        "  \"hp\": 170,\n"
-        "  \"types\": [\"Fire\"],\n"
-        "  \"stamps\": [],\n"
-        "  \"promo\": {\"isPromo\": false, \"series\": null, \"promoNumber\": null},\n"
-        "  \"number\": \"014/189\",\n"
-        "  \"set\": {\"name\": \"Darkness Ablaze\", \"code\": \"DAA\", \"total\": 189, \"symbolCode\": null},\n"
-        "  \"setboxLetters\": \"MEG\",\n"
-        "  \"printYear\": 2020,\n"
-        "  \"illustrator\": \"5ban Graphics\",\n"
-        "  \"text\": {\n"
-        "    \"abilities\": [{\"name\": \"Roaring Resolve\", \"text\": \"...\", \"kind\": \"Ability\"}],\n"
-        "    \"attacks\": [{\"name\": \"Flare Blitz\", \"cost\": [\"Fire\",\"Fire\"], \"damage\": \"120+\", \"text\": \"...\"}],\n"
-        "    \"weaknesses\": [{\"type\": \"Water\", \"value\": \"×2\"}],\n"
-        "    \"resistances\": [],\n"
-        "    \"retreatCost\": [\"Colorless\", \"Colorless\"]\n"
-        "  },\n"
-        "  \"notes\": {\"unreadable\": []},\n"
-        "  \"_confidence\": {\"name\": 0.95}\n"
-        "}"
+def _build_prompt(
+    header_uri: str, middle_uri: str, footer_uri: str, full_uri: Optional[str] = None
+) -> List[Dict[str, str]]:
+    prompt = list(_PROMPT_PREFIX)
+    if full_uri is not None:
+        prompt += (_FULL_LABEL, {"type": "input_image", "image_url": full_uri, "detail": "low"})
+    prompt += (
+        _HEADER_LABEL,
+        {"type": "input_image", "image_url": header_uri},
+        _MIDDLE_LABEL,
+        {"type": "input_image", "image_url": middle_uri},
+        _FOOTER_LABEL,
+        {"type": "input_image", "image_url": footer_uri},
     )
-
-    return [
-        {"type": "input_text", "text": instructions},
-        {"type": "input_text", "text": schema_hint},
-        {"type": "input_text", "text": format_hint},
-        {"type": "input_text", "text": "Primary card image:"},
-        {"type": "input_image", "image_url": f"data:image/png;base64,{full_b64}"},
-        {"type": "input_text", "text": "Header crop (name, stage/evolves from, HP, type banner):"},
-        {"type": "input_image", "image_url": f"data:image/png;base64,{header_b64}"},
-        {"type": "input_text", "text": "Main text area (abilities, attacks, rules):"},
-        {"type": "input_image", "image_url": f"data:image/png;base64,{middle_b64}"},
-        {"type": "input_text", "text": "Footer crop (setbox letters, card number, rarity, illustrator, year):"},
-        {"type": "input_image", "image_url": f"data:image/png;base64,{footer_b64}"},
-    ]
+    return prompt
 
 
 def extract_card_fields(pil_image) -> Dict[str, str]:
     """Return card row data enriched by structured JSON from the OpenAI Vision API."""
 
+    cache_key, request, cached = _prepare_request(pil_image)
+    if cached is not None:
+        return cached
+    json_text = _stream_response_text(_get_client(), **request)
+    return _finish_response(json_text, cache_key)
+
+
+async def extract_card_fields_async(pil_image, client: AsyncOpenAI) -> Dict[str, str]:
+    """Async :func:`extract_card_fields` on a caller-owned ``AsyncOpenAI`` client."""
+
+    # Image encoding is CPU work; keep it off the event loop.
+    cache_key, request, cached = await asyncio.to_thread(_prepare_request, pil_image)
+    if cached is not None:
+        return cached
+    response = await client.responses.create(**request)
+    return await asyncio.to_thread(_finish_response, _extract_response_text(response), cache_key)
+
+
+def extract_cards(
+    images: Sequence[Any], max_concurrency: Optional[int] = None
+) -> List[Union[Dict[str, str], BaseException]]:
+    """Run remote OCR for many images concurrently, in input order.
+
+    At most ``max_concurrency`` (default ``POKEDATA_REMOTE_CONCURRENCY``)
+    requests are in flight; the SDK's own retry/backoff handles 429s. A failed
+    card yields its exception in place rather than aborting the batch.
+    """
+
+    return asyncio.run(_extract_cards(images, max_concurrency or REMOTE_CONCURRENCY))
+
+
+async def _extract_cards(
+    images: Sequence[Any], max_concurrency: int
+) -> List[Union[Dict[str, str], BaseException]]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    # The async client is tied to this event loop, so it lives for one batch.
+    async with AsyncOpenAI(api_key=_require_api_key()) as client:
+
+        async def one(image) -> Dict[str, str]:
+            async with semaphore:
+                return await extract_card_fields_async(image, client)
+
+        return await asyncio.gather(*(one(image) for image in images), return_exceptions=True)
+
+
+def _downscale(pil_image):
     width, height = pil_image.size
-    header_crop = pil_image.crop((0, 0, width, int(height * 0.25)))
-    middle_crop = pil_image.crop((0, int(height * 0.25), width, int(height * 0.75)))
-    footer_crop = pil_image.crop((0, int(height * 0.75), width, height))
+    longest = max(width, height)
+    if longest <= MAX_IMAGE_EDGE:
+        return pil_image
+    scale = MAX_IMAGE_EDGE / longest
+    return pil_image.resize(
+        (max(1, round(width * scale)), max(1, round(height * scale))), Image.LANCZOS
+    )
+
 
-    full_b64 = _encode_image(pil_image)
-    header_b64 = _encode_image(header_crop)
-    middle_b64 = _encode_image(middle_crop)
-    footer_b64 = _encode_image(footer_crop)
+def _prepare_request(
+    pil_image,
+) -> Tuple[str, Dict[str, Any], Optional[Dict[str, str]]]:
+    """Return ``(cache_key, request kwargs, cached card fields or None)``."""
 
-    prompt = _build_prompt(full_b64, header_b64, middle_b64, footer_b64)
     model = os.getenv("POKEDATA_OPENAI_MODEL", "gpt-4o-mini")
+    cache_key = _result_cache_key(pil_image, model)
+    cached = _load_cached_result(cache_key)
+    if cached is not None:
+        data, validation_messages = cached
+        logger.debug("Remote OCR cache hit %s", cache_key)
+        return cache_key, {}, _card_fields_from(data, validation_messages)
+
+    pil_image = _downscale(pil_image)
+    width, height = pil_image.size
+    header_crop = pil_image.crop((0, 0, width, int(height * 0.25)))
+    middle_crop = pil_image.crop((0, int(height * 0.25), width, int(height * 0.75)))
+    footer_crop = pil_image.crop((0, int(height * 0.75), width, height))
 
-    client = _get_client()
-    validator = _get_validator()
-    response = client.responses.create(
-        model=model,
-        input=[
+    # The three crops tile the card, so the full image adds tokens, not detail.
+    # Pillow's JPEG encoder releases the GIL, so the encodes overlap.
+    crops = (header_crop, middle_crop, footer_crop)
+    if REMOTE_FULL_IMAGE:
+        crops += (pil_image,)
+    prompt = _build_prompt(*_ENCODE_POOL.map(_encode_image, crops))
+    request = {
+        "model": model,
+        "input": [
             {
                 "role": "system",
                 "content": [
@@ -145,30 +311,21 @@ def extract_card_fields(pil_image) -> Dict[str, str]:
             },
             {"role": "user", "content": prompt},
         ],
-        max_output_tokens=600,
-        temperature=0,
-    )
+        "max_output_tokens": 600,
+        "temperature": 0,
+        # JSON mode: the reply is a bare JSON object, never a fenced block.
+        "text": {"format": {"type": "json_object"}},
+    }
+    return cache_key, request, None
 
-    json_text = _extract_response_text(response)
-    json_text = json_text.strip()
-    if json_text.startswith("```"):
-        lines = [line for line in json_text.splitlines() if not line.strip().startswith("```")]
-        json_text = "\n".join(lines).strip()
-    logger.debug("Remote OCR raw response: %s", json_text)
-    try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError as exc:
-        dump_path = _write_debug_payload(json_text)
-        logger.warning(
-            "Remote OCR returned invalid JSON: %s | saved payload to %s",
-            exc,
-            dump_path,
-        )
-        raise
 
-    data = _normalize_payload(data)
+def _finish_response(json_text: str, cache_key: str) -> Dict[str, str]:
+    """Parse, normalise, validate and cache the model's JSON answer."""
 
-    errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+    logger.debug("Remote OCR raw response: %s", json_text)
+    data = _normalize_payload(json_utils.loads(json_text))
+
+    errors = _schema_errors(data)
     validation_messages: List[str] = []
     if errors:
         dump_path = _write_debug_payload(data)
@@ -178,13 +335,18 @@ def extract_card_fields(pil_image) -> Dict[str, str]:
             dump_path,
         )
         data = _repair_payload_for_validation(data, errors)
-        errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
+        errors = _schema_errors(data)
         if errors:
             validation_messages = [f"{list(err.path)}: {err.message}" for err in errors]
             logger.warning(
                 "Repaired payload still violates schema; proceeding with best-effort fields",
             )
 
+    _store_cached_result(cache_key, data, validation_messages)
+    return _card_fields_from(data, validation_messages)
+
+
+def _card_fields_from(data: Dict[str, object], validation_messages: List[str]) -> Dict[str, str]:
     card_fields = _map_structured_to_cardrow(data)
     card_fields["_structured_raw"] = data
     if validation_messages:
@@ -192,30 +354,72 @@ def extract_card_fields(pil_image) -> Dict[str, str]:
     return card_fields
 
 
+@functools.lru_cache(maxsize=1)
+def _prompt_fingerprint() -> str:
+    texts = [part["text"] for part in _build_prompt("", "", "", "" if REMOTE_FULL_IMAGE else None) if "text" in part]
+    texts.append(f"{IMAGE_MIME}:{JPEG_QUALITY}:{MAX_IMAGE_EDGE}:json_object")
+    return hashlib.blake2b("\0".join(texts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _result_cache_key(pil_image, model: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{pil_image.mode}:{pil_image.size}:{model}:{_prompt_fingerprint()}".encode("utf-8"))
+    h.update(pil_image.tobytes())
+    return h.hexdigest()
+
+
+def _load_cached_result(key: str) -> Optional[Tuple[Dict[str, object], List[str]]]:
+    if not RESULT_CACHE_ENABLED:
+        return None
+    try:
+        entry = json_utils.loads((RESULT_CACHE_DIR / f"{key}.json").read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, json_utils.JSONDecodeError):
+        logger.debug("Ignoring unreadable remote OCR cache entry %s", key, exc_info=True)
+        return None
+    if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+        return None
+    return entry["data"], list(entry.get("validation") or [])
+
+
+def _store_cached_result(
+    key: str, data: Dict[str, object], validation_messages: List[str]
+) -> None:
+    if not RESULT_CACHE_ENABLED:
+        return
+    path = RESULT_CACHE_DIR / f"{key}.json"
+    try:
+        cache_utils.atomic_write_json(path, {"data": data, "validation": validation_messages})
+    except OSError:
+        logger.debug("Could not write remote OCR cache entry %s", path, exc_info=True)
+
+
 def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
+    dget = data.get
     fields = {
-        "name": str(data.get("name", "")).strip(),
-        "hp": str(data.get("hp", "")),
-        "evolves_from": str(data.get("evolvesFrom", "")).strip(),
+        "name": str(dget("name", "")).strip(),
+        "hp": str(dget("hp", "")),
+        "evolves_from": str(dget("evolvesFrom", "")).strip(),
         "ability_name": "",
         "ability_text": "",
         "attacks": "",
         "set_code": "",
         "set_name": "",
-        "card_number": str(data.get("number", "")).strip(),
-        "artist": str(data.get("illustrator", "")).strip(),
+        "card_number": str(dget("number", "")).strip(),
+        "artist": str(dget("illustrator", "")).strip(),
         "weakness": "",
         "resistance": "",
         "retreat": "",
         "notes": "",
-        "rarity": str(data.get("rarity", "")),
+        "rarity": str(dget("rarity", "")),
     }
 
-    hp_val = data.get("hp")
+    hp_val = dget("hp")
     if isinstance(hp_val, int):
         fields["hp"] = str(hp_val)
 
-    text_block = data.get("text", {})
+    text_block = dget("text", {})
     abilities: List[str] = []
     ability_details: List[str] = []
     attacks: List[Dict[str, str]] = []
@@ -224,8 +428,9 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
     retreat_cost = []
 
     if isinstance(text_block, dict):
+        text_get = text_block.get
         # Abilities
-        for ability in text_block.get("abilities", []) or []:
+        for ability in text_get("abilities", []) or []:
             name = ability.get("name", "") if isinstance(ability, dict) else ""
             text = ability.get("text", "") if isinstance(ability, dict) else ""
             if name:
@@ -239,7 +444,7 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
                     ability_details.append(text)
 
         # Attacks
-        for attack in text_block.get("attacks", []) or []:
+        for attack in text_get("attacks", []) or []:
             if not isinstance(attack, dict):
                 continue
             name = str(attack.get("name", "")) if attack.get("name") is not None else ""
@@ -257,19 +462,19 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
             )
 
         # Weaknesses / Resistances
-        for wk in text_block.get("weaknesses", []) or []:
+        for wk in text_get("weaknesses", []) or []:
             if isinstance(wk, dict):
                 wt = wk.get("type", "")
                 val = wk.get("value", "")
                 weaknesses.append(f"{wt} {val}".strip())
 
-        for rs in text_block.get("resistances", []) or []:
+        for rs in text_get("resistances", []) or []:
             if isinstance(rs, dict):
                 rt = rs.get("type", "")
                 val = rs.get("value", "")
                 resistances.append(f"{rt} {val}".strip())
 
-        retreat_cost = [c for c in text_block.get("retreatCost", []) or [] if isinstance(c, str)]
+        retreat_cost = [c for c in text_get("retreatCost", []) or [] if isinstance(c, str)]
 
     if ability_details and not fields["ability_text"]:
         fields["ability_text"] = "\n\n".join(ability_details)
@@ -284,24 +489,27 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
     if retreat_cost:
         fields["retreat"] = " / ".join(retreat_cost)
 
-    set_block = data.get("set", {})
+    set_block = dget("set", {})
     if isinstance(set_block, dict):
         fields["set_name"] = str(set_block.get("name", ""))
         code = set_block.get("code")
         if isinstance(code, str):
             fields["set_code"] = code
 
-    setbox_letters = data.get("setboxLetters")
-    promo = data.get("promo") if isinstance(data.get("promo"), dict) else {}
-    stage = data.get("stage", "")
-    types = data.get("types", [])
-    print_year = data.get("printYear")
+    setbox_letters = dget("setboxLetters")
+    promo = dget("promo")
+    if not isinstance(promo, dict):
+        promo = {}
+    stage = dget("stage", "")
+    types = dget("types", [])
+    print_year = dget("printYear")
+    stamps = dget("stamps")
 
-    notes_value = data.get("notes")
+    notes_value = dget("notes")
     if isinstance(notes_value, str):
         try:
-            notes_value = json.loads(notes_value)
-        except json.JSONDecodeError:
+            notes_value = json_utils.loads(notes_value)
+        except json_utils.JSONDecodeError:
             notes_value = {"raw": notes_value}
 
     if not isinstance(notes_value, dict):
@@ -315,14 +523,14 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
         "promoSeries": promo.get("series") if isinstance(promo, dict) else None,
         "promoNumber": promo.get("promoNumber") if isinstance(promo, dict) else None,
         "printYear": print_year,
-        "stamps": data.get("stamps") if isinstance(data.get("stamps"), list) else None,
+        "stamps": stamps if isinstance(stamps, list) else None,
     }
     for key, value in notes_payload.items():
         if value not in (None, "", []):
             notes_value[key] = value
 
     if notes_value:
-        fields["notes"] = json.dumps(notes_value, ensure_ascii=False)
+        fields["notes"] = json_utils.dumps_str(notes_value)
 
     return fields
 
@@ -330,132 +538,156 @@ def _map_structured_to_cardrow(data: Dict[str, object]) -> Dict[str, str]:
 def _write_debug_payload(payload) -> Path:
     debug_dir = Path("logs/remote_debug")
     debug_dir.mkdir(parents=True, exist_ok=True)
-    filename = f"payload_{len(list(debug_dir.glob('payload_*.json'))):04d}.json"
+    # Timestamp + counter: unique and time-ordered without listing the directory.
+    filename = f"payload_{time.time_ns():x}_{next(_DEBUG_COUNTER):04d}.json"
     dump_path = debug_dir / filename
     try:
         if isinstance(payload, str):
             dump_path.write_text(payload, encoding="utf-8")
         else:
-            dump_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            dump_path.write_bytes(json_utils.dumps(payload, indent=True))
     except Exception as exc:  # pragma: no cover
         logger.debug("Failed to write debug payload: %s", exc)
     return dump_path
 
 
-def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
-    result = dict(data)
+# Canonical spellings for the model's free-form type, stage and stamp values.
+_TYPE_MAP = {
+    "": "",
+    "colorless": "Colorless",
+    "dark": "Darkness",
+    "darkness": "Darkness",
+    "dragon": "Dragon",
+    "fairy": "Fairy",
+    "fighting": "Fighting",
+    "ground": "Fighting",
+    "rock": "Fighting",
+    "fire": "Fire",
+    "grass": "Grass",
+    "leaf": "Grass",
+    "lightning": "Lightning",
+    "electric": "Lightning",
+    "metal": "Metal",
+    "steel": "Metal",
+    "psychic": "Psychic",
+    "ghost": "Psychic",
+    "water": "Water",
+    "ice": "Water",
+}
+
+_STAGE_MAP = {
+    "basic": "Basic",
+    "stage 1": "Stage 1",
+    "stage1": "Stage 1",
+    "stage-1": "Stage 1",
+    "stage 2": "Stage 2",
+    "stage2": "Stage 2",
+    "stage-2": "Stage 2",
+    "mega evolution": "Mega Evolution",
+    "mega": "Mega Evolution",
+    "break": "BREAK",
+    "legend": "LEGEND",
+    "restored": "Restored",
+}
+
+_STAMP_ALIASES = {
+    "pre-release": "pre-release",
+    "pre release": "pre-release",
+    "prerelease": "pre-release",
+    "staff": "staff",
+    "league": "league",
+    "winner": "winner",
+    "pokemon-center": "pokemon-center",
+    "pokemon center": "pokemon-center",
+    "pokemoncenter": "pokemon-center",
+    "worlds": "worlds",
+    "world championships": "worlds",
+    "none": "none",
+}
+
+_SPACES_RE = re.compile(r"\s+")
+_DIGITS_RE = re.compile(r"\D+")
+
+_STRING_FIELDS = (
+    "name",
+    "stage",
+    "evolvesFrom",
+    "number",
+    "rarity",
+    "setboxLetters",
+    "ability_name",
+    "ability_text",
+    "attacks",
+    "set_code",
+    "set_name",
+    "card_number",
+    "artist",
+    "weakness",
+    "resistance",
+    "retreat",
+)
+
+
+def _canonical_stamp(value: str) -> Optional[str]:
+    key = value.strip().lower()
+    key = key.replace("_", "-")
+    key = _SPACES_RE.sub("-", key)
+    return _STAMP_ALIASES.get(key)
+
+
+def _canonical_type(value: str) -> str:
+    key = value.strip().lower()
+    return _TYPE_MAP.get(key, value.strip().title())
+
+
+def _canonicalize_types(values: Iterable[str]) -> List[str]:
+    # A dict dedupes in O(1) per value and keeps first-seen order.
+    cleaned: Dict[str, None] = {}
+    for value in values:
+        if not isinstance(value, str):
+            continue
+        canonical = _canonical_type(value)
+        if canonical:
+            cleaned[canonical] = None
+    return list(cleaned)
 
-    type_map = {
-        "": "",
-        "colorless": "Colorless",
-        "dark": "Darkness",
-        "darkness": "Darkness",
-        "dragon": "Dragon",
-        "fairy": "Fairy",
-        "fighting": "Fighting",
-        "ground": "Fighting",
-        "rock": "Fighting",
-        "fire": "Fire",
-        "grass": "Grass",
-        "leaf": "Grass",
-        "lightning": "Lightning",
-        "electric": "Lightning",
-        "metal": "Metal",
-        "steel": "Metal",
-        "psychic": "Psychic",
-        "ghost": "Psychic",
-        "water": "Water",
-        "ice": "Water",
-    }
 
-    stage_map = {
-        "basic": "Basic",
-        "stage 1": "Stage 1",
-        "stage1": "Stage 1",
-        "stage-1": "Stage 1",
-        "stage 2": "Stage 2",
-        "stage2": "Stage 2",
-        "stage-2": "Stage 2",
-        "mega evolution": "Mega Evolution",
-        "mega": "Mega Evolution",
-        "break": "BREAK",
-        "legend": "LEGEND",
-        "restored": "Restored",
-    }
+def _clean_str(value, default=""):
+    if value is None:
+        return default
+    return str(value)
 
-    stamp_aliases = {
-        "pre-release": "pre-release",
-        "pre release": "pre-release",
-        "prerelease": "pre-release",
-        "staff": "staff",
-        "league": "league",
-        "winner": "winner",
-        "pokemon-center": "pokemon-center",
-        "pokemon center": "pokemon-center",
-        "pokemoncenter": "pokemon-center",
-        "worlds": "worlds",
-        "world championships": "worlds",
-        "none": "none",
-    }
 
-    def _canonical_stamp(value: str) -> Optional[str]:
-        key = value.strip().lower()
-        key = key.replace("_", "-")
-        key = re.sub(r"\s+", "-", key)
-        return stamp_aliases.get(key)
+def _clamp_conf(value) -> float:
+    try:
+        numeric = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    if numeric < 0.0:
+        return 0.0
+    if numeric > 1.0:
+        return 1.0
+    return float(numeric)
 
-    def _canonical_type(value: str) -> str:
-        key = value.strip().lower()
-        return type_map.get(key, value.strip().title())
 
-    def _canonicalize_types(values: Iterable[str]) -> List[str]:
-        cleaned: List[str] = []
-        for value in values:
-            if not isinstance(value, str):
-                continue
-            canonical = _canonical_type(value)
-            if canonical and canonical not in cleaned:
-                cleaned.append(canonical)
-        return cleaned
-
-    def _clean_str(value, default=""):
-        if value is None:
-            return default
-        if isinstance(value, (int, float)):
-            return str(value)
-        return str(value)
-
-    for key in [
-        "name",
-        "stage",
-        "evolvesFrom",
-        "number",
-        "rarity",
-        "setboxLetters",
-        "ability_name",
-        "ability_text",
-        "attacks",
-        "set_code",
-        "set_name",
-        "card_number",
-        "artist",
-        "weakness",
-        "resistance",
-        "retreat",
-    ]:
+def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
+    result = dict(data)
+
+    for key in _STRING_FIELDS:
         if key in result:
             result[key] = _clean_str(result[key])
 
     stage_value = result.get("stage")
     if isinstance(stage_value, str):
         stage_key = stage_value.strip().lower()
-        if stage_key in stage_map:
-            result["stage"] = stage_map[stage_key]
+        if stage_key in _STAGE_MAP:
+            result["stage"] = _STAGE_MAP[stage_key]
 
-    if isinstance(result.get("hp"), str) and result["hp"].isdigit():
-        result["hp"] = int(result["hp"])
-    if result.get("hp") is None:
+    hp = result.get("hp")
+    if hp is None:
         result["hp"] = ""
+    elif isinstance(hp, str) and hp.isdigit():
+        result["hp"] = int(hp)
 
     stamps_value = result.get("stamps")
     if isinstance(stamps_value, list):
@@ -502,7 +734,9 @@ def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
                     cleaned = cleaned.upper()
                 set_block[subkey] = cleaned
         total = set_block.get("total")
-        if isinstance(total, str) and total.isdigit():
+        if type(total) is int:
+            pass
+        elif isinstance(total, str) and total.isdigit():
             set_block["total"] = int(total)
         elif isinstance(total, (int, float)):
             set_block["total"] = int(total)
@@ -524,8 +758,11 @@ def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
         result["illustrator"] = _clean_str(illustrator).strip()
 
     print_year = result.get("printYear")
-    if isinstance(print_year, str):
-        digits = "".join(ch for ch in print_year if ch.isdigit())
+    if type(print_year) is int:
+        if not 1990 <= print_year <= 2100:
+            result.pop("printYear", None)
+    elif isinstance(print_year, str):
+        digits = _DIGITS_RE.sub("", print_year)
         if digits:
             year_val = int(digits)
             if 1990 <= year_val <= 2100:
@@ -545,11 +782,12 @@ def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
 
     text_block = result.get("text")
     if isinstance(text_block, dict):
+        text_get = text_block.get
         result_types = result.get("types")
         if isinstance(result_types, list):
             result["types"] = _canonicalize_types(result_types)
 
-        attacks = text_block.get("attacks")
+        attacks = text_get("attacks")
         if isinstance(attacks, list):
             for attack in attacks:
                 if isinstance(attack, dict):
@@ -560,36 +798,25 @@ def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
                     cost = attack.get("cost")
                     if isinstance(cost, list):
                         attack["cost"] = _canonicalize_types(cost)
-        abilities = text_block.get("abilities")
+        abilities = text_get("abilities")
         if isinstance(abilities, list):
             for ability in abilities:
                 if isinstance(ability, dict) and ability.get("text") is None:
                     ability["text"] = ""
         for key in ("weaknesses", "resistances"):
-            entries = text_block.get(key)
+            entries = text_get(key)
             if isinstance(entries, list):
                 for entry in entries:
                     if isinstance(entry, dict):
                         poke_type = entry.get("type")
                         if isinstance(poke_type, str):
                             entry["type"] = _canonical_type(poke_type)
-        retreat_cost = text_block.get("retreatCost")
+        retreat_cost = text_get("retreatCost")
         if isinstance(retreat_cost, list):
             text_block["retreatCost"] = _canonicalize_types(retreat_cost)
     elif text_block is None:
         result["text"] = {}
 
-    def _clamp_conf(value) -> float:
-        try:
-            numeric = float(value)
-        except (TypeError, ValueError):
-            return 0.0
-        if numeric < 0.0:
-            return 0.0
-        if numeric > 1.0:
-            return 1.0
-        return float(numeric)
-
     confidence = result.get("_confidence")
     if isinstance(confidence, dict):
         cleaned_conf: Dict[str, float] = {}
@@ -620,8 +847,8 @@ def _normalize_payload(data: Dict[str, object]) -> Dict[str, object]:
         notes_val = {"raw": notes_val}
     elif isinstance(notes_val, str):
         try:
-            notes_val = json.loads(notes_val)
-        except json.JSONDecodeError:
+            notes_val = json_utils.loads(notes_val)
+        except json_utils.JSONDecodeError:
             notes_val = {"raw": notes_val}
 
     if isinstance(notes_val, dict):
@@ -738,25 +965,51 @@ def _default_for_schema_type(schema) -> object:
     return ""
 
 
+def _stream_response_text(client: OpenAI, **request) -> str:
+    """Run a Responses request as a stream and return its output text.
+
+    Text deltas are collected as they arrive instead of waiting for the full
+    response object to be built and parsed. SDKs without ``responses.stream``
+    fall back to a plain ``create`` call.
+    """
+
+    stream_fn = getattr(client.responses, "stream", None)
+    if stream_fn is None:
+        return _extract_response_text(client.responses.create(**request))
+
+    chunks: List[str] = []
+    with stream_fn(**request) as stream:
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+        if chunks:
+            return "".join(chunks)
+        return _extract_response_text(stream.get_final_response())
+
+
 def _extract_response_text(response) -> str:
-    # The Responses API returns a structured object. We gather any text content.
-    parts: List[str] = []
+    # Current SDKs aggregate the text parts in .output_text; older ones need the
+    # structured output walked.
     try:
-        for item in getattr(response, "output", []) or []:
-            for content in getattr(item, "content", []) or []:
-                text_obj = getattr(content, "text", None)
-                if isinstance(text_obj, str):
-                    parts.append(text_obj)
-                else:
-                    value = getattr(text_obj, "value", None)
-                    if value:
-                        parts.append(value)
-        if parts:
-            return "\n".join(parts)
-        # Fallback for .output_text helper (newer SDKs)
         text = getattr(response, "output_text", None)
         if text:
             return text
+        text = "\n".join(
+            part
+            for item in getattr(response, "output", None) or ()
+            for content in getattr(item, "content", None) or ()
+            for part in (_content_text(content),)
+            if part
+        )
+        if text:
+            return text
     except Exception as exc:  # pragma: no cover - defensive
         logger.warning("Failed to read response text: %s", exc)
     raise ValueError("No text output returned from OpenAI response")
+
+
+def _content_text(content) -> Optional[str]:
+    text_obj = getattr(content, "text", None)
+    if isinstance(text_obj, str):
+        return text_obj
+    return getattr(text_obj, "value", None)
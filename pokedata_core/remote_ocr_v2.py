@@ -10,25 +10,26 @@ Phase 1 (current): Stage 1 only
 
 from __future__ import annotations
 
-import base64
-import io
-import json
+import asyncio
+import hashlib
 import os
-from pathlib import Path
+import re
+import time
 from typing import Dict, Any, List, Optional
 
-from jsonschema import Draft202012Validator
 from openai import OpenAI
 
+from . import cache_utils, json_utils, schema_registry
 from .logging_utils import get_logger
+from .remote_ocr import REMOTE_CONCURRENCY, _downscale, _encode_image, _extract_response_text
 
 
 logger = get_logger("remote_ocr_v2")
 
 _CLIENT: Optional[OpenAI] = None
-_STAGE1_SCHEMA = None
-_STAGE1_VALIDATOR: Optional[Draft202012Validator] = None
-STAGE1_SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "stage1_schema.json"
+# A whole ``` fence line (``` or ```json), removed in one pass.
+_FENCE_RE = re.compile(r"^[ \t]*```.*(?:\n|\Z)", re.M)
+STAGE1_SCHEMA_PATH = schema_registry.SCHEMA_DIR / "stage1_schema.json"
 
 
 # ============================================================================
@@ -117,6 +118,24 @@ Example Output for Basic Pokémon:
 """
 
 
+STAGE1_BATCH_INSTRUCTIONS = """You are given {count} separate cards, labelled Card 1 to Card {count}.
+
+Analyze each card independently using the rules above. Respond with a JSON object of the form
+{{"cards": [<Card 1 result>, <Card 2 result>, ...]}}
+with exactly {count} entries, in card order, each having the fields described above."""
+
+# Output budget per card; a batch request gets this times the number of cards.
+STAGE1_TOKENS_PER_CARD = 300
+# Cards sent per Vision API request by extract_cards_batch_v2.
+STAGE1_BATCH_SIZE = 8
+
+# Stage 1 results keyed by card pixels, so re-scanned cards skip the API call.
+# POKEDATA_NO_CACHE=1 bypasses it, like the other result caches.
+STAGE1_CACHE_ENABLED = cache_utils.CACHE_ENABLED
+STAGE1_CACHE_DIR = cache_utils.cache_dir("stage1")
+STAGE1_CACHE_MAX_AGE = 30 * 86400  # seconds
+
+
 # ============================================================================
 # Client & Validator Initialization
 # ============================================================================
@@ -134,78 +153,59 @@ def _get_client() -> OpenAI:
     return _CLIENT
 
 
-def _get_stage1_validator() -> Draft202012Validator:
-    """Get or create Stage 1 JSON schema validator."""
-    global _STAGE1_SCHEMA, _STAGE1_VALIDATOR
-    if _STAGE1_VALIDATOR is None:
-        if not STAGE1_SCHEMA_PATH.exists():
-            raise RuntimeError(f"Stage 1 schema not found at {STAGE1_SCHEMA_PATH}")
-        _STAGE1_SCHEMA = json.loads(STAGE1_SCHEMA_PATH.read_text())
-        _STAGE1_VALIDATOR = Draft202012Validator(_STAGE1_SCHEMA)
-    return _STAGE1_VALIDATOR
-
-
-# ============================================================================
-# Image Encoding
-# ============================================================================
-
-def _encode_image(pil_img) -> str:
-    """Encode PIL Image to base64 PNG."""
-    buffer = io.BytesIO()
-    pil_img.save(buffer, format="PNG")
-    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+# Built at import so the first card skips the schema read; a missing or broken
+# schema is still reported on first use.
+schema_registry.preload(STAGE1_SCHEMA_PATH)
 
 
 # ============================================================================
 # Stage 1: Card Identification
 # ============================================================================
 
-def _build_stage1_prompt(full_b64: str) -> List[Dict[str, str]]:
+def _build_stage1_prompt(full_uri: str) -> List[Dict[str, str]]:
     """
     Build Stage 1 prompt (simple, single image).
 
     Args:
-        full_b64: Base64-encoded full card image
+        full_uri: ``data:`` URI of the full card image
 
     Returns:
         Prompt content list for Vision API
     """
     return [
         {"type": "input_text", "text": STAGE1_INSTRUCTIONS},
-        {"type": "input_image", "image_url": f"data:image/png;base64,{full_b64}"}
+        {"type": "input_image", "image_url": full_uri}
     ]
 
 
-def _stage1_identification(pil_image) -> Dict[str, Any]:
+def _build_stage1_batch_prompt(card_uris: List[str]) -> List[Dict[str, str]]:
     """
-    Stage 1: Card Identification.
-
-    Extracts 5 critical fields:
-    - name (string)
-    - cardType (pokemon | trainer | energy)
-    - hp (integer or null)
-    - stage (string or null)
-    - evolvesFrom (string or null)
+    Build Stage 1 prompt for several cards in one request.
 
     Args:
-        pil_image: PIL Image of the card
+        card_uris: ``data:`` URIs of the full card images, in output order
 
     Returns:
-        Dict with stage1 fields + _confidence scores
+        Prompt content list for Vision API
+    """
+    prompt = [
+        {"type": "input_text", "text": STAGE1_INSTRUCTIONS},
+        {"type": "input_text", "text": STAGE1_BATCH_INSTRUCTIONS.format(count=len(card_uris))},
+    ]
+    for index, card_uri in enumerate(card_uris, start=1):
+        prompt.append({"type": "input_text", "text": f"Card {index}:"})
+        prompt.append({"type": "input_image", "image_url": card_uri})
+    return prompt
+
+
+def _request_stage1(prompt: List[Dict[str, str]], max_output_tokens: int) -> Any:
+    """
+    Send a Stage 1 prompt and parse the JSON reply.
 
     Raises:
         RuntimeError: If API key not set
         ValueError: If API returns invalid JSON
-        Exception: If API call fails
     """
-    logger.debug("Starting Stage 1 identification")
-
-    # Encode full card image
-    full_b64 = _encode_image(pil_image)
-
-    # Build prompt
-    prompt = _build_stage1_prompt(full_b64)
-
     # Get model from env (default: gpt-4o-mini)
     model = os.getenv("POKEDATA_OPENAI_MODEL", "gpt-4o-mini")
 
@@ -224,7 +224,7 @@ def _stage1_identification(pil_image) -> Dict[str, Any]:
             },
             {"role": "user", "content": prompt}
         ],
-        max_output_tokens=300,  # Less than v1.0 (600) - simpler response expected
+        max_output_tokens=max_output_tokens,
         temperature=0,
     )
 
@@ -234,22 +234,23 @@ def _stage1_identification(pil_image) -> Dict[str, Any]:
 
     # Strip markdown code blocks if present
     if json_text.startswith("```"):
-        lines = [line for line in json_text.splitlines() if not line.strip().startswith("```")]
-        json_text = "\n".join(lines).strip()
+        json_text = _FENCE_RE.sub("", json_text).strip()
 
     logger.debug("Stage 1 raw response: %s", json_text[:200])
 
     # Parse JSON
     try:
-        data = json.loads(json_text)
-    except json.JSONDecodeError as exc:
+        return json_utils.loads(json_text)
+    except json_utils.JSONDecodeError as exc:
         logger.error("Stage 1 returned invalid JSON: %s", exc)
         logger.error("Raw response: %s", json_text)
         raise ValueError(f"Stage 1 JSON parsing failed: {exc}")
 
+
+def _finish_stage1(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one Stage 1 result and fill in missing confidence scores."""
     # Validate against schema
-    validator = _get_stage1_validator()
-    errors = list(validator.iter_errors(data))
+    errors = schema_registry.schema_errors(STAGE1_SCHEMA_PATH, data)
 
     if errors:
         error_messages = [f"{list(err.path)}: {err.message}" for err in errors]
@@ -278,6 +279,134 @@ def _stage1_identification(pil_image) -> Dict[str, Any]:
     return data
 
 
+def _stage1_identification(pil_image) -> Dict[str, Any]:
+    """
+    Stage 1: Card Identification.
+
+    Extracts 5 critical fields:
+    - name (string)
+    - cardType (pokemon | trainer | energy)
+    - hp (integer or null)
+    - stage (string or null)
+    - evolvesFrom (string or null)
+
+    Args:
+        pil_image: PIL Image of the card
+
+    Returns:
+        Dict with stage1 fields + _confidence scores
+
+    Raises:
+        RuntimeError: If API key not set
+        ValueError: If API returns invalid JSON
+        Exception: If API call fails
+    """
+    logger.debug("Starting Stage 1 identification")
+
+    # Encode full card image (same size cap and encoder as v1.0)
+    full_uri = _encode_image(_downscale(pil_image))
+
+    # Build prompt
+    prompt = _build_stage1_prompt(full_uri)
+
+    # Less than v1.0 (600) - simpler response expected
+    data = _request_stage1(prompt, STAGE1_TOKENS_PER_CARD)
+    return _finish_stage1(data)
+
+
+def _stage1_identification_batch(pil_images: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Stage 1 for several cards, answering repeat cards from the disk cache.
+
+    Cards not in the cache share one Vision API request.
+
+    Args:
+        pil_images: PIL Images of the cards (at most STAGE1_BATCH_SIZE)
+
+    Returns:
+        One Stage 1 dict per image, in input order
+
+    Raises:
+        RuntimeError: If API key not set
+        ValueError: If API returns invalid JSON or the wrong number of cards
+    """
+    keys = [_stage1_cache_key(img) for img in pil_images]
+    results: List[Optional[Dict[str, Any]]] = [_load_cached_stage1(key) for key in keys]
+    missing = [index for index, data in enumerate(results) if data is None]
+    if len(missing) < len(results):
+        logger.debug("Stage 1 cache hit for %d card(s)", len(results) - len(missing))
+    if missing:
+        fresh = _stage1_request_batch([pil_images[index] for index in missing])
+        for index, data in zip(missing, fresh):
+            results[index] = data
+            _store_cached_stage1(keys[index], data)
+    return results
+
+
+def _stage1_request_batch(pil_images: List[Any]) -> List[Dict[str, Any]]:
+    """Stage 1 for ``pil_images`` with one Vision API request (no cache)."""
+    if len(pil_images) == 1:
+        return [_stage1_identification(pil_images[0])]
+
+    logger.debug("Starting Stage 1 identification for %d cards", len(pil_images))
+    prompt = _build_stage1_batch_prompt(
+        [_encode_image(_downscale(img)) for img in pil_images]
+    )
+    data = _request_stage1(prompt, STAGE1_TOKENS_PER_CARD * len(pil_images))
+
+    cards = data.get("cards") if isinstance(data, dict) else data
+    if not isinstance(cards, list) or len(cards) != len(pil_images):
+        raise ValueError(
+            f"Stage 1 batch returned {len(cards) if isinstance(cards, list) else 'no'} "
+            f"cards for {len(pil_images)} images"
+        )
+    return [_finish_stage1(card if isinstance(card, dict) else {}) for card in cards]
+
+
+# ============================================================================
+# Stage 1 Result Cache
+# ============================================================================
+
+def _stage1_cache_key(pil_image) -> str:
+    """Key a Stage 1 result by card pixels, model and prompt text."""
+    model = os.getenv("POKEDATA_OPENAI_MODEL", "gpt-4o-mini")
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{pil_image.mode}:{pil_image.size}:{model}:".encode("utf-8"))
+    h.update(STAGE1_SYSTEM_PROMPT.encode("utf-8"))
+    h.update(STAGE1_INSTRUCTIONS.encode("utf-8"))
+    h.update(pil_image.tobytes())
+    return h.hexdigest()
+
+
+def _load_cached_stage1(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached Stage 1 result younger than STAGE1_CACHE_MAX_AGE."""
+    if not STAGE1_CACHE_ENABLED:
+        return None
+    path = STAGE1_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > STAGE1_CACHE_MAX_AGE:
+            path.unlink()
+            return None
+        data = json_utils.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.debug("Ignoring unreadable Stage 1 cache entry %s", key, exc_info=True)
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _store_cached_stage1(key: str, data: Dict[str, Any]) -> None:
+    """Write a Stage 1 result to the cache (best effort)."""
+    if not STAGE1_CACHE_ENABLED:
+        return
+    path = STAGE1_CACHE_DIR / f"{key}.json"
+    try:
+        cache_utils.atomic_write_json(path, data)
+    except OSError:
+        logger.debug("Could not write Stage 1 cache entry %s", path, exc_info=True)
+
+
 # ============================================================================
 # Stage 2 & 3 Stubs (TODO)
 # ============================================================================
@@ -377,7 +506,7 @@ def _merge_stages(stage1: Dict, stage2: Dict = None, stage3: Dict = None) -> Dic
         "rarity": "",
 
         # Store metadata in notes
-        "notes": json.dumps(notes, ensure_ascii=False)
+        "notes": json_utils.dumps_str(notes)
     }
 
     return fields
@@ -404,69 +533,93 @@ def extract_card_fields_v2(pil_image) -> Dict[str, str]:
         RuntimeError: If API key not set
         ValueError: If API returns invalid response
     """
-    logger.info("Starting v2.0 extraction (Stage 1 only)")
+    return extract_cards_batch_v2([pil_image])[0]
 
-    # Stage 1: Identification
-    stage1_data = _stage1_identification(pil_image)
 
-    # TODO Phase 1: Implement Stage 2 & 3
-    # if stage1_data["cardType"] == "pokemon":
-    #     stage2_data = _stage2_combat_stats(pil_image, stage1_data)
-    # else:
-    #     stage2_data = {}
-    #
-    # stage3_data = _stage3_metadata(pil_image)
+def extract_cards_batch_v2(pil_images: List[Any]) -> List[Dict[str, str]]:
+    """
+    v2.0 staged extraction for many cards, STAGE1_BATCH_SIZE per API request.
 
-    # For now, just Stage 1
-    stage2_data = None
-    stage3_data = None
+    Sending several cards per request saves a network round-trip and the
+    repeated system prompt for every card after the first.
 
-    # Merge and return
-    result = _merge_stages(stage1_data, stage2_data, stage3_data)
+    Args:
+        pil_images: PIL Images of cards
 
-    logger.info("v2.0 extraction complete: name=%s, type=%s", result["name"], result["card_type"])
+    Returns:
+        One dict with CardRow fields per image, in input order
 
-    return result
+    Raises:
+        RuntimeError: If API key not set
+        ValueError: If API returns invalid response
+    """
+    logger.info("Starting v2.0 extraction (Stage 1 only) for %d card(s)", len(pil_images))
 
+    if len(pil_images) <= STAGE1_BATCH_SIZE:
+        return _extract_batch(pil_images)
+    return asyncio.run(_extract_batches_async(pil_images, REMOTE_CONCURRENCY))
 
-# ============================================================================
-# Utility Functions
-# ============================================================================
 
-def _extract_response_text(response) -> str:
+async def extract_card_fields_v2_async(pil_image) -> Dict[str, str]:
+    """Async extract_card_fields_v2 (the blocking API call runs in a worker thread)."""
+    return (await extract_cards_batch_v2_async([pil_image]))[0]
+
+
+async def extract_cards_batch_v2_async(
+    pil_images: List[Any], max_concurrency: Optional[int] = None
+) -> List[Dict[str, str]]:
     """
-    Extract text content from OpenAI Responses API response.
+    Async extract_cards_batch_v2: batches of STAGE1_BATCH_SIZE cards run concurrently.
 
     Args:
-        response: OpenAI API response object
+        pil_images: PIL Images of cards
+        max_concurrency: Batch requests in flight (default POKEDATA_REMOTE_CONCURRENCY)
 
     Returns:
-        Extracted text content
-
-    Raises:
-        ValueError: If no text content found
+        One dict with CardRow fields per image, in input order
     """
-    parts: List[str] = []
-    try:
-        for item in getattr(response, "output", []) or []:
-            for content in getattr(item, "content", []) or []:
-                text_obj = getattr(content, "text", None)
-                if isinstance(text_obj, str):
-                    parts.append(text_obj)
-                else:
-                    value = getattr(text_obj, "value", None)
-                    if value:
-                        parts.append(value)
-
-        if parts:
-            return "\n".join(parts)
-
-        # Fallback for .output_text helper (newer SDKs)
-        text = getattr(response, "output_text", None)
-        if text:
-            return text
-
-    except Exception as exc:
-        logger.warning("Failed to read response text: %s", exc)
-
-    raise ValueError("No text output returned from OpenAI response")
+    return await _extract_batches_async(pil_images, max_concurrency or REMOTE_CONCURRENCY)
+
+
+async def _extract_batches_async(
+    pil_images: List[Any], max_concurrency: int
+) -> List[Dict[str, str]]:
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def run(batch: List[Any]) -> List[Dict[str, str]]:
+        async with semaphore:
+            return await asyncio.to_thread(_extract_batch, batch)
+
+    batches = [
+        pil_images[start:start + STAGE1_BATCH_SIZE]
+        for start in range(0, len(pil_images), STAGE1_BATCH_SIZE)
+    ]
+    batch_results = await asyncio.gather(*(run(batch) for batch in batches))
+    return [result for batch_result in batch_results for result in batch_result]
+
+
+def _extract_batch(pil_images: List[Any]) -> List[Dict[str, str]]:
+    """Run all stages for one Stage 1 batch and merge each card's results."""
+    results: List[Dict[str, str]] = []
+    # Stage 1: Identification
+    for stage1_data in _stage1_identification_batch(pil_images):
+        # TODO Phase 1: Implement Stage 2 & 3 (independent; run them concurrently)
+        # if stage1_data["cardType"] == "pokemon":
+        #     stage2_data = _stage2_combat_stats(pil_image, stage1_data)
+        # else:
+        #     stage2_data = {}
+        #
+        # stage3_data = _stage3_metadata(pil_image)
+
+        # For now, just Stage 1
+        stage2_data = None
+        stage3_data = None
+
+        # Merge and return
+        result = _merge_stages(stage1_data, stage2_data, stage3_data)
+        logger.info(
+            "v2.0 extraction complete: name=%s, type=%s", result["name"], result["card_type"]
+        )
+        results.append(result)
+
+    return results
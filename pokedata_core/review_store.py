@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import json
 import re
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
+from . import json_utils
 from .pipeline import ProcessResult
 from .logging_utils import get_logger
 
@@ -29,7 +29,7 @@ def _slugify(text: str) -> str:
 
 def store_run(result: ProcessResult, source_name: str) -> Dict[str, Any]:
     root = _ensure_runs_root()
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     base = f"{now.strftime('%Y%m%d-%H%M%S')}_{_slugify(source_name)}"
     run_dir = root / base
     counter = 1
@@ -71,7 +71,7 @@ def store_run(result: ProcessResult, source_name: str) -> Dict[str, Any]:
                 data["image"] = original_to_dest[image_key]
             structured_payload.append(data)
         structured_path = run_dir / "cards.json"
-        structured_path.write_text(json.dumps(structured_payload, indent=2), encoding="utf-8")
+        structured_path.write_bytes(json_utils.dumps(structured_payload, indent=True))
 
     meta: Dict[str, Any] = {
         "run_id": run_dir.name,
@@ -83,8 +83,7 @@ def store_run(result: ProcessResult, source_name: str) -> Dict[str, Any]:
         "has_structured": bool(structured_payload),
     }
 
-    with (run_dir / "run.json").open("w", encoding="utf-8") as fp:
-        json.dump(meta, fp, indent=2)
+    (run_dir / "run.json").write_bytes(json_utils.dumps(meta, indent=True))
 
     logger.info("Stored run %s with %d pages", meta["run_id"], len(pages))
     return meta
@@ -96,9 +95,8 @@ def read_structured(run_id: str) -> List[Dict[str, Any]]:
     if not cards_path.exists():
         return []
     try:
-        with cards_path.open(encoding="utf-8") as fp:
-            return json.load(fp)
-    except json.JSONDecodeError:
+        return json_utils.loads(cards_path.read_bytes())
+    except json_utils.JSONDecodeError:
         logger.warning("Malformed cards.json for run %s", run_id)
         return []
 
@@ -118,7 +116,13 @@ LOW_CONFIDENCE_FIELDS = [
 ]
 
 
-def low_confidence_entries(run_id: str, threshold: float = 0.9) -> List[Dict[str, Any]]:
+def low_confidence_entries(run_id: str, threshold: float = 0.9) -> Iterator[Dict[str, Any]]:
+    """Yield fields below ``threshold``, least confident first.
+
+    This is a generator, so a missing run only raises ``FileNotFoundError`` once
+    iteration starts; callers that need to fail early should ``load_run`` first.
+    """
+
     structured = read_structured(run_id)
     results: List[Dict[str, Any]] = []
     for entry in structured:
@@ -146,7 +150,7 @@ def low_confidence_entries(run_id: str, threshold: float = 0.9) -> List[Dict[str
                     }
                 )
     results.sort(key=lambda item: item.get("confidence", 0.0))
-    return results
+    yield from results
 
 
 def _lookup_confidence(block: Dict[str, Any], field: str) -> Optional[float]:
@@ -175,9 +179,8 @@ def _lookup_field(data: Dict[str, Any], field: str) -> Any:
 def append_feedback(run_id: str, payload: Dict[str, Any]) -> Path:
     run = load_run(run_id)
     feedback_path = Path(run["run_dir"]) / "human_feedback.jsonl"
-    with feedback_path.open("a", encoding="utf-8") as fp:
-        fp.write(json.dumps(payload))
-        fp.write("\n")
+    with feedback_path.open("ab") as fp:
+        fp.write(json_utils.dumps(payload) + b"\n")
     logger.info(
         "Recorded feedback for %s field %s (action=%s)",
         run_id,
@@ -197,9 +200,8 @@ def list_runs() -> List[Dict[str, Any]]:
         if not meta_path.exists():
             continue
         try:
-            with meta_path.open(encoding="utf-8") as fp:
-                meta = json.load(fp)
-        except json.JSONDecodeError:
+            meta = json_utils.loads(meta_path.read_bytes())
+        except json_utils.JSONDecodeError:
             continue
         meta["run_id"] = path.name
         runs.append(meta)
@@ -212,8 +214,7 @@ def load_run(run_id: str) -> Dict[str, Any]:
     meta_path = run_dir / "run.json"
     if not meta_path.exists():
         raise FileNotFoundError(run_id)
-    with meta_path.open(encoding="utf-8") as fp:
-        meta = json.load(fp)
+    meta = json_utils.loads(meta_path.read_bytes())
     meta["run_id"] = run_id
     meta["run_dir"] = str(run_dir)
     return meta
@@ -228,6 +229,14 @@ def get_image_path(run_id: str, image_name: str) -> Path:
     return image_path
 
 
+def get_csv_path(run_id: str) -> Path:
+    run = load_run(run_id)
+    csv_path = Path(run["run_dir"]) / run.get("csv", "cards.csv")
+    if not csv_path.exists():
+        raise FileNotFoundError(csv_path.name)
+    return csv_path
+
+
 def read_annotations(run_id: str, image_name: str) -> List[Dict[str, Any]]:
     run = load_run(run_id)
     annotations_dir = Path(run["run_dir"]) / "annotations"
@@ -235,8 +244,7 @@ def read_annotations(run_id: str, image_name: str) -> List[Dict[str, Any]]:
     file_path = annotations_dir / f"{Path(image_name).stem}.json"
     if not file_path.exists():
         return []
-    with file_path.open(encoding="utf-8") as fp:
-        return json.load(fp)
+    return json_utils.loads(file_path.read_bytes())
 
 
 def write_annotations(run_id: str, image_name: str, annotations: List[Dict[str, Any]]) -> None:
@@ -244,8 +252,7 @@ def write_annotations(run_id: str, image_name: str, annotations: List[Dict[str,
     annotations_dir = Path(run["run_dir"]) / "annotations"
     annotations_dir.mkdir(parents=True, exist_ok=True)
     file_path = annotations_dir / f"{Path(image_name).stem}.json"
-    with file_path.open("w", encoding="utf-8") as fp:
-        json.dump(annotations, fp, indent=2)
+    file_path.write_bytes(json_utils.dumps(annotations, indent=True))
     logger.info(
         "Saved %d annotation(s) for %s/%s", len(annotations), run_id, Path(image_name).name
     )
@@ -0,0 +1,159 @@
+"""Compiled JSON Schema validators shared by the remote OCR modules.
+
+Each schema file is read and compiled once per process. Valid payloads are
+answered by the fastest installed backend — :mod:`jsonschema_rs` (a compiled
+2020-12 validator), else :mod:`fastjsonschema` generated code when the schema
+stays within draft 7 — and only failing payloads are walked by ``jsonschema``,
+whose error objects the callers log and repair from.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from jsonschema import Draft202012Validator
+
+from .logging_utils import get_logger
+
+try:
+    import jsonschema_rs  # type: ignore
+
+    _HAS_JSONSCHEMA_RS = True
+except Exception:  # pragma: no cover - optional dependency
+    jsonschema_rs = None  # type: ignore
+    _HAS_JSONSCHEMA_RS = False
+
+try:
+    import fastjsonschema  # type: ignore
+
+    _HAS_FASTJSONSCHEMA = True
+except Exception:  # pragma: no cover - optional dependency
+    fastjsonschema = None  # type: ignore
+    _HAS_FASTJSONSCHEMA = False
+
+
+logger = get_logger("schema_registry")
+
+SCHEMA_DIR = Path(__file__).resolve().parent / "schemas"
+
+# Keywords whose 2019-09/2020-12 meaning fastjsonschema (drafts 4-7) lacks.
+_POST_DRAFT7_KEYWORDS = frozenset(
+    {
+        "prefixItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+        "dependentRequired",
+        "dependentSchemas",
+        "minContains",
+        "maxContains",
+        "$dynamicRef",
+        "$recursiveRef",
+    }
+)
+
+
+@functools.lru_cache(maxsize=8)
+def load_schema(schema_path: Path) -> Any:
+    if not schema_path.exists():
+        raise RuntimeError(f"Schema not found at {schema_path}")
+    schema = json.loads(schema_path.read_text())
+    # Reject a malformed schema once, here, rather than through odd per-card errors.
+    Draft202012Validator.check_schema(schema)
+    return schema
+
+
+@functools.lru_cache(maxsize=8)
+def validator_for(schema_path: Path) -> Draft202012Validator:
+    """The ``jsonschema`` validator for ``schema_path`` (used to enumerate errors)."""
+
+    return Draft202012Validator(load_schema(schema_path))
+
+
+@functools.lru_cache(maxsize=8)
+def fast_check_for(schema_path: Path) -> Optional[Callable[[Any], bool]]:
+    """A compiled ``is_valid`` for ``schema_path``, or ``None`` without a fast backend."""
+
+    schema = load_schema(schema_path)
+    if _HAS_JSONSCHEMA_RS:
+        check = _compile_jsonschema_rs(schema)
+        if check is not None:
+            return check
+    return _compile_fastjsonschema(schema)
+
+
+def schema_errors(schema_path: Path, data: Any) -> List[Any]:
+    """Validation errors for ``data``, sorted by path; empty when it is valid."""
+
+    fast_check = fast_check_for(schema_path)
+    if fast_check is not None and fast_check(data):
+        return []
+    err_iter = validator_for(schema_path).iter_errors(data)
+    first = next(err_iter, None)
+    if first is None:
+        return []
+    return sorted([first, *err_iter], key=lambda e: tuple(e.path))
+
+
+def preload(schema_path: Path) -> None:
+    """Compile ``schema_path`` now; a missing or broken schema is left for first use."""
+
+    try:
+        validator_for(schema_path)
+        fast_check_for(schema_path)
+    except Exception:
+        logger.debug("Schema %s not loaded at import", schema_path.name, exc_info=True)
+
+
+def _compile_jsonschema_rs(schema: Any) -> Optional[Callable[[Any], bool]]:
+    try:
+        validator_cls = getattr(jsonschema_rs, "Draft202012Validator", None)
+        if validator_cls is None:  # releases before 0.20
+            validator = jsonschema_rs.JSONSchema(schema, draft=jsonschema_rs.Draft202012)
+        else:
+            # "format" is an annotation in 2020-12, as in Draft202012Validator.
+            validator = validator_cls(schema, validate_formats=False)
+    except Exception:
+        logger.debug("jsonschema-rs could not compile the schema", exc_info=True)
+        return None
+    return validator.is_valid
+
+
+def _uses_post_draft7_keywords(node: Any) -> bool:
+    if isinstance(node, dict):
+        if _POST_DRAFT7_KEYWORDS.intersection(node):
+            return True
+        return any(_uses_post_draft7_keywords(value) for value in node.values())
+    if isinstance(node, list):
+        return any(_uses_post_draft7_keywords(value) for value in node)
+    return False
+
+
+def _compile_fastjsonschema(schema: Any) -> Optional[Callable[[Any], bool]]:
+    """Compile ``schema`` to generated code with fastjsonschema, when that is exact.
+
+    fastjsonschema only implements drafts 4-7. For schemas that stay within the
+    keywords those drafts share with 2020-12 its verdict matches
+    ``Draft202012Validator``; otherwise (or when it is not installed) ``None``.
+    """
+
+    if not _HAS_FASTJSONSCHEMA or _uses_post_draft7_keywords(schema):
+        return None
+    try:
+        # Match Draft202012Validator's defaults: "format" is only an annotation
+        # and "default" never writes into the payload being checked.
+        validate = fastjsonschema.compile(schema, use_default=False, use_formats=False)
+    except Exception:
+        logger.debug("fastjsonschema could not compile the schema", exc_info=True)
+        return None
+
+    def is_valid(data: Any) -> bool:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return is_valid
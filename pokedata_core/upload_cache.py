@@ -0,0 +1,136 @@
+"""Content-addressed cache of CSV results for previously processed uploads."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional
+
+from . import json_utils
+from .logging_utils import get_logger
+from .pipeline import settings_fingerprint
+from .review_store import RUNS_ROOT
+
+try:
+    import blake3  # type: ignore
+
+    _HAS_BLAKE3 = True
+except Exception:  # pragma: no cover - optional dependency
+    _HAS_BLAKE3 = False
+
+
+logger = get_logger("upload_cache")
+
+CACHE_DIR = RUNS_ROOT / "cache"
+try:
+    CACHE_MAX_BYTES = max(0, int(os.getenv("POKEDATA_UPLOAD_CACHE_MB", "512"))) * 1024 * 1024
+except (TypeError, ValueError):
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_ENTRY_CSV = "cards.csv"
+_ENTRY_META = "entry.json"
+_PRUNE_LOCK = threading.Lock()
+
+
+@dataclass
+class CachedUpload:
+    # Opened under the prune lock so a concurrent eviction cannot pull the
+    # file out from under the response; the caller closes it.
+    csv_file: BinaryIO
+    run_id: str
+    rows: int
+
+
+def cache_enabled() -> bool:
+    return CACHE_MAX_BYTES > 0
+
+
+def new_hasher() -> Any:
+    """Return an incremental hasher for upload bytes (BLAKE3 when installed)."""
+
+    if _HAS_BLAKE3:
+        return blake3.blake3()
+    return hashlib.blake2b(digest_size=32)
+
+
+def cache_key(content_digest: str, *, dpi: int, limit: int) -> str:
+    # A change to an output-affecting setting must not serve a CSV produced
+    # under the old configuration.
+    return f"{content_digest}-{dpi}-{limit}-{settings_fingerprint()}"
+
+
+def lookup(key: str) -> Optional[CachedUpload]:
+    """Return the cached result for ``key`` and mark it recently used."""
+
+    if not cache_enabled():
+        return None
+    entry_dir = CACHE_DIR / key
+    meta_path = entry_dir / _ENTRY_META
+    csv_path = entry_dir / _ENTRY_CSV
+    with _PRUNE_LOCK:
+        try:
+            meta = json_utils.loads(meta_path.read_bytes())
+            csv_file = csv_path.open("rb")
+        except (OSError, json_utils.JSONDecodeError):
+            return None
+        try:
+            os.utime(meta_path)  # atime is unreliable (noatime mounts); mtime drives LRU
+        except OSError:
+            pass
+    run_id = meta.get("run_id", "")
+    if run_id and not (RUNS_ROOT / run_id).is_dir():
+        run_id = ""  # the review run was deleted; the cached CSV is still valid
+    return CachedUpload(csv_file=csv_file, run_id=run_id, rows=int(meta.get("rows", 0)))
+
+
+def store(key: str, csv_path: Path, *, run_id: str, rows: int) -> None:
+    """Hardlink ``csv_path`` into the cache under ``key`` and prune to the size bound."""
+
+    if not cache_enabled():
+        return
+    entry_dir = CACHE_DIR / key
+    try:
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        dest = entry_dir / _ENTRY_CSV
+        if dest.exists():
+            dest.unlink()
+        try:
+            os.link(csv_path, dest)
+        except OSError:
+            shutil.copy2(csv_path, dest)
+        meta: Dict[str, Any] = {"run_id": run_id, "rows": rows}
+        (entry_dir / _ENTRY_META).write_bytes(json_utils.dumps(meta))
+    except OSError:
+        logger.warning("Could not cache upload result %s", key, exc_info=True)
+        shutil.rmtree(entry_dir, ignore_errors=True)
+        return
+    _prune()
+
+
+def _prune() -> None:
+    """Evict least recently used entries until the cache fits ``CACHE_MAX_BYTES``."""
+
+    with _PRUNE_LOCK:
+        entries = []
+        total = 0
+        for entry_dir in CACHE_DIR.iterdir():
+            try:
+                size = (entry_dir / _ENTRY_CSV).stat().st_size
+                used = (entry_dir / _ENTRY_META).stat().st_mtime
+            except OSError:
+                continue
+            entries.append((used, size, entry_dir))
+            total += size
+        if total <= CACHE_MAX_BYTES:
+            return
+        entries.sort()
+        for _, size, entry_dir in entries:
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            logger.debug("Evicted cached upload %s", entry_dir.name)
+            if total <= CACHE_MAX_BYTES:
+                break
@@ -0,0 +1,51 @@
+"""Reusable scratch directories for staging uploads."""
+
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import tempfile
+from pathlib import Path
+
+from .logging_utils import get_logger
+
+
+logger = get_logger("upload_pool")
+
+POOL_ROOT = Path(
+    os.getenv("POKEDATA_UPLOAD_POOL_DIR") or Path(tempfile.gettempdir()) / "pokedata_pool"
+)
+POOL_SIZE = 16
+
+_POOL: "queue.LifoQueue[Path]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
+def acquire_workdir() -> Path:
+    """Check out an empty scratch directory, creating one if the pool is empty."""
+
+    try:
+        return _POOL.get_nowait()
+    except queue.Empty:
+        POOL_ROOT.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix="work_", dir=POOL_ROOT))
+
+
+def release_workdir(path: Path) -> None:
+    """Empty ``path`` and return it to the pool (or delete it when the pool is full)."""
+
+    try:
+        for entry in path.iterdir():
+            if entry.is_dir() and not entry.is_symlink():
+                shutil.rmtree(entry)
+            else:
+                entry.unlink()
+    except OSError:
+        logger.warning("Discarding upload workdir %s that could not be cleared", path, exc_info=True)
+        shutil.rmtree(path, ignore_errors=True)
+        return
+
+    try:
+        _POOL.put_nowait(path)
+    except queue.Full:
+        shutil.rmtree(path, ignore_errors=True)